@@ -51,10 +51,8 @@ async def preview(args) -> None:
 async def list_blueprints(args) -> None:
     """List all blueprints."""
     blueprints = await runloop_api_client().blueprints.list(name=args.name)
-    [
+    for blueprint in blueprints.blueprints or []:
         print(f"blueprints={blueprint.model_dump_json(indent=4)}")
-        for blueprint in blueprints.blueprints or []
-    ]
 
 
 async def get(args) -> None:
@@ -68,4 +66,5 @@ async def logs(args) -> None:
     """Get blueprint build logs."""
     assert args.id is not None
     logs = await runloop_api_client().blueprints.logs(args.id)
-    [print(f"{log.timestamp_ms} {log.level} {log.message}") for log in logs.logs or []]
+    for log in logs.logs or []:
+        print(f"{log.timestamp_ms} {log.level} {log.message}")
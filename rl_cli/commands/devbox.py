@@ -1,12 +1,12 @@
 """Devbox command group implementation."""
 
 import asyncio
-import datetime
 import json
 import os
+import random
 import shlex
+import shutil
 import signal
-import subprocess
 import sys
 import time
 
@@ -20,6 +20,21 @@ from runloop_api_client.types.shared_params.launch_parameters import UserParamet
 
 from ..utils import runloop_api_client, ssh_url, _args_to_dict
 
+# Size of each chunk streamed between a devbox file and local disk
+FILE_CHUNK_SIZE = 1 << 20
+
+# Inputs larger than this are sent by `write` through the streaming upload endpoint
+WRITE_FILE_MAX_BYTES = 1 << 20
+
+# Number of log lines joined into a single write by `devbox logs`
+LOG_PRINT_BATCH = 1000
+
+# Upper bound for the backoff delay between devbox status polls
+POLL_BACKOFF_CAP_SEC = 15.0
+
+# Seconds a cached SSH key on disk is reused before asking the API for a new one
+SSH_KEY_TTL_SEC = 600
+
 
 def _parse_code_mounts(arg) -> CodeMountParameters | None:
     """Parse code mounts argument."""
@@ -134,9 +149,9 @@ async def send_stdin(args) -> None:
 
     # Build request body
     kwargs = {}
-    if hasattr(args, "text") and args.text is not None:
+    if args.text is not None:
         kwargs["text"] = args.text
-    if hasattr(args, "signal") and args.signal is not None:
+    if args.signal is not None:
         kwargs["signal"] = args.signal
 
     result = await runloop_api_client().devboxes.executions.send_std_in(
@@ -149,23 +164,32 @@ async def logs(args) -> None:
     """Get devbox logs."""
     assert args.id is not None
     logs = await runloop_api_client().devboxes.logs.list(args.id)
+    lines: list[str] = []
+    last_sec = None
+    sec_str = ""
     for log in logs.logs or []:
-        time_str = (
-            datetime.datetime.fromtimestamp(log.timestamp_ms / 1000.0).strftime(
-                "%Y-%m-%d %H:%M:%S.%f"
-            )[:-3]
-            if log.timestamp_ms
-            else ""
-        )
+        time_str = ""
+        if log.timestamp_ms:
+            sec, ms = divmod(int(log.timestamp_ms), 1000)
+            # Consecutive entries usually share a second; format it only once
+            if sec != last_sec:
+                last_sec = sec
+                sec_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            time_str = f"{sec_str}.{ms:03d}"
         source: str = f" [{log.source}]" if log.source else ""
         if log.cmd is not None:
-            print(f"{time_str}{source} -> {log.cmd}")
+            lines.append(f"{time_str}{source} -> {log.cmd}")
         elif log.message is not None:
-            print(f"{time_str}{source}  {log.message}")
+            lines.append(f"{time_str}{source}  {log.message}")
         elif log.exit_code is not None:
-            print(f"{time_str}{source} -> exit_code={log.exit_code}")
+            lines.append(f"{time_str}{source} -> exit_code={log.exit_code}")
         else:
-            print(f"{time_str}{source}  {log}")
+            lines.append(f"{time_str}{source}  {log}")
+        if len(lines) >= LOG_PRINT_BATCH:
+            print("\n".join(lines))
+            lines.clear()
+    if lines:
+        print("\n".join(lines))
 
 
 async def suspend(args) -> None:
@@ -190,8 +214,41 @@ async def shutdown(args) -> None:
 
 
 # SSH related functions
-async def get_ssh_key(devbox_id: str) -> tuple[str, str, str, str] | None:
-    """Get or create SSH key for a devbox."""
+def _read_cached_ssh_key(
+    keyfile_path: str, urlfile_path: str
+) -> tuple[str, str, str, str] | None:
+    """Return a previously written SSH key if it is younger than SSH_KEY_TTL_SEC."""
+    if not (os.path.exists(keyfile_path) and os.path.exists(urlfile_path)):
+        return None
+    try:
+        now = time.time()
+        for path in (keyfile_path, urlfile_path):
+            if now - os.stat(path).st_mtime > SSH_KEY_TTL_SEC:
+                return None
+        with open(keyfile_path, "r", encoding="utf-8") as f:
+            key = f.read()
+        with open(urlfile_path, "r", encoding="utf-8") as f:
+            url, user = f.read().splitlines()
+    except (OSError, ValueError):
+        return None
+    return keyfile_path, key, url, user
+
+
+async def get_ssh_key(
+    devbox_id: str, refresh: bool = False
+) -> tuple[str, str, str, str] | None:
+    """Get or create SSH key for a devbox.
+
+    A key written within the last ``SSH_KEY_TTL_SEC`` seconds is served from
+    disk unless ``refresh`` is set.
+    """
+    keyfile_path = os.path.expanduser(f"~/.runloop/ssh_keys/{devbox_id}.pem")
+    urlfile_path = os.path.expanduser(f"~/.runloop/ssh_keys/{devbox_id}.url")
+    if not refresh:
+        cached = _read_cached_ssh_key(keyfile_path, urlfile_path)
+        if cached:
+            return cached
+
     result = await runloop_api_client().devboxes.create_ssh_key(devbox_id)
     if not result:
         print("Failed to create ssh key")
@@ -202,12 +259,12 @@ async def get_ssh_key(devbox_id: str) -> tuple[str, str, str, str] | None:
     user: str = result.ssh_user or "user"
 
     os.makedirs(os.path.expanduser("~/.runloop/ssh_keys"), exist_ok=True)
-    keyfile_path = os.path.expanduser(f"~/.runloop/ssh_keys/{devbox_id}.pem")
     with open(keyfile_path, "w", encoding="utf-8") as f:
         f.write(key)
-        f.flush()
-        os.fsync(f.fileno())
     os.chmod(keyfile_path, 0o600)
+    # Written after the key so a fresh url file always implies a complete key
+    with open(urlfile_path, "w", encoding="utf-8") as f:
+        f.write(f"{url}\n{user}\n")
 
     return keyfile_path, key, url, user
 
@@ -215,10 +272,17 @@ async def get_ssh_key(devbox_id: str) -> tuple[str, str, str, str] | None:
 async def wait_for_ready(
     devbox_id: str, timeout_seconds: int = 180, poll_interval_seconds: int = 3
 ) -> bool:
-    """Wait for a devbox to be ready."""
-    start_time = time.time()
+    """Wait for a devbox to be ready.
+
+    Polls start at ``poll_interval_seconds`` and back off exponentially (with
+    jitter) up to ``POLL_BACKOFF_CAP_SEC``.
+    """
+    start_time = time.monotonic()
+    delay = float(poll_interval_seconds)
+    last_status = None
 
     while True:
+        error = None
         try:
             devbox = await runloop_api_client().devboxes.retrieve(devbox_id)
 
@@ -232,11 +296,13 @@ async def wait_for_ready(
                 print(f"Devbox {devbox_id} is not running (status: {devbox.status})")
                 return False
             else:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 remaining = timeout_seconds - elapsed
-                print(
-                    f"Devbox {devbox_id} is still {devbox.status}... (elapsed: {elapsed:.0f}s, remaining: {remaining:.0f}s)"
-                )
+                if devbox.status != last_status:
+                    last_status = devbox.status
+                    print(
+                        f"Devbox {devbox_id} is still {devbox.status}... (elapsed: {elapsed:.0f}s, remaining: {remaining:.0f}s)"
+                    )
 
                 if elapsed >= timeout_seconds:
                     print(
@@ -244,20 +310,35 @@ async def wait_for_ready(
                     )
                     return False
 
-                await asyncio.sleep(poll_interval_seconds)
-
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed >= timeout_seconds:
                 print(
                     f"Timeout waiting for devbox {devbox_id} to be ready after {timeout_seconds} seconds (error: {e})"
                 )
                 return False
+            error = e
 
+        # Jitter the backoff, but never sleep past the deadline
+        remaining = timeout_seconds - (time.monotonic() - start_time)
+        pause = max(0.0, min(delay * random.uniform(0.8, 1.2), remaining))
+        if error is not None:
             print(
-                f"Error checking devbox status: {e}, retrying in {poll_interval_seconds} seconds..."
+                f"Error checking devbox status: {error}, retrying in {pause:.0f} seconds..."
             )
-            await asyncio.sleep(poll_interval_seconds)
+        await asyncio.sleep(pause)
+        delay = min(delay * 2, POLL_BACKOFF_CAP_SEC)
+
+
+def _proxy_command() -> str:
+    """Build the ssh ProxyCommand that tunnels through the Runloop TLS endpoint."""
+    return f"openssl s_client -quiet -servername %h -connect {ssh_url()} 2>/dev/null"
+
+
+async def _run_command(command: list[str]) -> int:
+    """Run a command in a child process without blocking the event loop."""
+    proc = await asyncio.create_subprocess_exec(*command)
+    return await proc.wait()
 
 
 async def ssh(args) -> None:
@@ -274,7 +355,7 @@ async def ssh(args) -> None:
             print(f"Devbox {args.id} is not ready. Please try again later.")
             return
 
-    ssh_info = await get_ssh_key(args.id)
+    ssh_info = await get_ssh_key(args.id, args.refresh_key)
     if not ssh_info:
         return
 
@@ -290,20 +371,17 @@ Host {args.id}
   StrictHostKeyChecking no
   ServerAliveInterval 15
   ServerAliveCountMax 3
-  ProxyCommand openssl s_client -quiet -servername %h -connect {ssh_url()} 2>/dev/null
+  ProxyCommand {_proxy_command()}
             """
         )
         return
 
-    proxy_command = (
-        f"openssl s_client -quiet -servername %h -connect {ssh_url()} 2>/dev/null"
-    )
     command = [
         "/usr/bin/ssh",
         "-i",
         keyfile_path,
         "-o",
-        f"ProxyCommand={proxy_command}",
+        f"ProxyCommand={_proxy_command()}",
         "-o",
         "StrictHostKeyChecking=no",
         "-o",
@@ -312,7 +390,33 @@ Host {args.id}
         "ServerAliveCountMax=3",
         f"{user}@{url}",
     ]
-    subprocess.run(command)
+    await _run_command(command)
+
+
+def _copy_local(src: str, dst: str) -> None:
+    """Copy between two local paths the way `rsync -vr` does.
+
+    Follows rsync's trailing-slash rules: a dir src without one is copied
+    into dst, and a dst with one is created as a directory. Each copied file
+    is listed relative to the transfer root, as rsync -v lists it.
+    """
+    if os.path.isdir(src):
+        if src.endswith(os.sep):
+            root = src
+        else:
+            root = os.path.dirname(os.path.abspath(src))
+            dst = os.path.join(dst, os.path.basename(src))
+
+        def copy_listed(src_file, dst_file):
+            print(os.path.relpath(src_file, root))
+            return shutil.copy2(src_file, dst_file)
+
+        shutil.copytree(src, dst, copy_function=copy_listed, dirs_exist_ok=True)
+    else:
+        if dst.endswith(os.sep):
+            os.makedirs(dst, exist_ok=True)
+        shutil.copy2(src, dst)
+        print(os.path.basename(src))
 
 
 async def scp(args) -> None:
@@ -321,22 +425,31 @@ async def scp(args) -> None:
     assert args.src is not None
     assert args.dst is not None
 
-    ssh_info = await get_ssh_key(args.id)
+    # A local file to a local path: copy directly instead of spawning scp.
+    # Anything else (directories, a dst that is not yet a dir but ends in a
+    # slash) goes to scp itself so its usual errors are reported
+    local_only = not args.src.startswith(":") and not args.dst.startswith(":")
+    if (
+        local_only
+        and not args.scp_options
+        and os.path.isfile(args.src)
+        and (os.path.isdir(args.dst) or not args.dst.endswith(os.sep))
+    ):
+        await asyncio.to_thread(shutil.copy2, args.src, args.dst)
+        return
+
+    ssh_info = await get_ssh_key(args.id, args.refresh_key)
     if not ssh_info:
         return
 
     keyfile_path, _, url, user = ssh_info
 
-    proxy_command = (
-        f"openssl s_client -quiet -servername %h -connect {ssh_url()} 2> /dev/null"
-    )
-
     scp_command = [
         "scp",
         "-i",
         keyfile_path,
         "-o",
-        f"ProxyCommand={proxy_command}",
+        f"ProxyCommand={_proxy_command()}",
         "-o",
         "StrictHostKeyChecking=no",
     ]
@@ -354,11 +467,10 @@ async def scp(args) -> None:
         else:
             scp_command.append(args.dst)
 
-    try:
-        subprocess.run(scp_command, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"SCP command failed with exit code {e.returncode}")
-        sys.exit(e.returncode)
+    returncode = await _run_command(scp_command)
+    if returncode != 0:
+        print(f"SCP command failed with exit code {returncode}")
+        sys.exit(returncode)
 
 
 async def rsync(args) -> None:
@@ -367,17 +479,19 @@ async def rsync(args) -> None:
     assert args.src is not None
     assert args.dst is not None
 
-    ssh_info = await get_ssh_key(args.id)
+    # Both paths are local: copy directly instead of spawning rsync over ssh
+    local_only = not args.src.startswith(":") and not args.dst.startswith(":")
+    if local_only and not args.rsync_options:
+        await asyncio.to_thread(_copy_local, args.src, args.dst)
+        return
+
+    ssh_info = await get_ssh_key(args.id, args.refresh_key)
     if not ssh_info:
         return
 
     keyfile_path, _, url, user = ssh_info
 
-    proxy_command = (
-        f"openssl s_client -quiet -servername %h -connect {ssh_url()} 2> /dev/null"
-    )
-
-    ssh_options = f"-i {keyfile_path} -o ProxyCommand='{proxy_command}' -o StrictHostKeyChecking=no"
+    ssh_options = f"-i {keyfile_path} -o ProxyCommand='{_proxy_command()}' -o StrictHostKeyChecking=no"
 
     rsync_command = [
         "rsync",
@@ -401,11 +515,10 @@ async def rsync(args) -> None:
         else:
             rsync_command.append(args.dst)
 
-    try:
-        subprocess.run(rsync_command, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Rsync command failed with exit code {e.returncode}")
-        sys.exit(e.returncode)
+    returncode = await _run_command(rsync_command)
+    if returncode != 0:
+        print(f"Rsync command failed with exit code {returncode}")
+        sys.exit(returncode)
 
 
 async def tunnel(args) -> None:
@@ -418,21 +531,18 @@ async def tunnel(args) -> None:
 
     local_port, remote_port = args.ports.split(":")
 
-    ssh_info = await get_ssh_key(args.id)
+    ssh_info = await get_ssh_key(args.id, args.refresh_key)
     if not ssh_info:
         return
 
     keyfile_path, _, url, user = ssh_info
 
-    proxy_command = (
-        f"openssl s_client -quiet -servername %h -connect {ssh_url()} 2> /dev/null"
-    )
     command = [
         "/usr/bin/ssh",
         "-i",
         keyfile_path,
         "-o",
-        f"ProxyCommand={proxy_command}",
+        f"ProxyCommand={_proxy_command()}",
         "-o",
         "StrictHostKeyChecking=no",
         "-N",  # Do not execute a remote command
@@ -444,17 +554,26 @@ async def tunnel(args) -> None:
     print(f"Starting tunnel: local port {local_port} -> remote port {remote_port}")
     print("Press Ctrl+C to stop the tunnel.")
 
-    def signal_handler(sig, frame):
-        print("\nStopping tunnel...")
-        sys.exit(0)
+    proc = await asyncio.create_subprocess_exec(*command)
+    stopped = False
 
-    signal.signal(signal.SIGINT, signal_handler)
+    def stop_tunnel():
+        nonlocal stopped
+        stopped = True
+        print("\nStopping tunnel...")
+        if proc.returncode is None:
+            proc.terminate()
 
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, stop_tunnel)
     try:
-        subprocess.run(command)
-    except subprocess.CalledProcessError as e:
-        print(f"Tunnel creation failed with exit code {e.returncode}")
-        sys.exit(e.returncode)
+        returncode = await proc.wait()
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+
+    if returncode != 0 and not stopped:
+        print(f"Tunnel creation failed with exit code {returncode}")
+        sys.exit(returncode)
 
 
 # File operations
@@ -472,11 +591,14 @@ async def read_file(args) -> None:
     """Read a file from a devbox."""
     assert args.id is not None
     assert args.output is not None
-    contents = await runloop_api_client().devboxes.read_file_contents(
+    # Stream the contents straight to disk instead of buffering the whole file
+    streaming = runloop_api_client().devboxes.with_streaming_response
+    async with streaming.read_file_contents(
         id=args.id, file_path=args.remote
-    )
-    with open(args.output, "w", encoding="utf-8") as f:
-        f.write(contents)
+    ) as response:
+        with open(args.output, "wb") as f:
+            async for chunk in response.iter_bytes(FILE_CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
     print(
         f"Wrote remote file {args.remote} from devbox {args.id} to local file {args.output}"
     )
@@ -489,11 +611,19 @@ async def write_file(args) -> None:
     assert args.remote is not None
     if not os.path.exists(args.input):
         raise FileNotFoundError(f"Input file {args.input} does not exist")
-    with open(args.input, "r", encoding="utf-8") as f:
-        contents = f.read()
-    await runloop_api_client().devboxes.write_file_contents(
-        id=args.id, file_path=args.remote, contents=contents
-    )
+    if os.path.getsize(args.input) > WRITE_FILE_MAX_BYTES:
+        # write_file_contents takes the whole file as a JSON string; stream
+        # large files through the binary upload endpoint instead
+        with open(args.input, "rb") as f:
+            await runloop_api_client().devboxes.upload_file(
+                id=args.id, path=args.remote, file=f
+            )
+    else:
+        with open(args.input, "r", encoding="utf-8") as f:
+            contents = await asyncio.to_thread(f.read)
+        await runloop_api_client().devboxes.write_file_contents(
+            id=args.id, file_path=args.remote, contents=contents
+        )
     print(
         f"Wrote local file {args.input} to remote file {args.remote} on devbox {args.id}"
     )
@@ -1,7 +1,7 @@
 """Object command group implementation."""
 
 import os
-import io
+import errno
 import shutil
 import tempfile
 import zipfile
@@ -9,8 +9,12 @@ import tarfile
 import aiohttp
 import asyncio
 import sys
+import time
 import zstandard
 import inspect
+import random
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from tabulate import tabulate
 from ..utils import runloop_api_client
 
@@ -18,11 +22,41 @@ from ..utils import runloop_api_client
 RETRY_ATTEMPTS = int(os.getenv("RUNLOOP_RETRIES", "3"))
 RETRY_BASE_DELAY_SEC = float(os.getenv("RUNLOOP_RETRY_BASE_DELAY", "0.5"))
 
+# Per-connection limits for object transfers; no cap on the whole transfer
+TRANSFER_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+
+# Size of each chunk moved between the network and local disk (override via env)
+IO_CHUNK_SIZE = max(1, int(os.getenv("RUNLOOP_IO_CHUNK", str(1 << 20))))
+
+# Bytes of a response gathered in memory before each write to disk
+WRITE_BATCH_SIZE = 4 << 20
+
+# Size of each byte range requested when a download is split into parts
+DOWNLOAD_PART_SIZE = 8 << 20
+
+# Maximum number of byte ranges downloaded at the same time (override via env)
+DOWNLOAD_CONCURRENCY = max(1, int(os.getenv("RUNLOOP_MAX_CONCURRENCY", "8")))
+
+# Largest zstd window accepted when decompressing (what `zstd --long=31` produces)
+ZSTD_MAX_WINDOW_SIZE = 1 << 31
+
+# Read/write block size when decompressing zstd archives
+ZSTD_BUFFER_SIZE = 4 << 20
+
+# Minimum seconds between progress updates written to the terminal
+PROGRESS_INTERVAL_SEC = 0.05
+
+# Bytes uploaded between page cache releases for the file being sent
+PAGE_CACHE_DROP_INTERVAL = 64 << 20
+
 
 def _is_transient_error(error: Exception) -> bool:
     """Heuristic to classify transient server/network errors suitable for retry."""
-    if isinstance(error, aiohttp.ClientError):
+    if isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError)):
         return True
+    status = getattr(error, "status_code", getattr(error, "status", None))
+    if isinstance(status, int):
+        return status >= 500
     text = str(error)
     if any(token in text for token in (" 500", " 502", " 503", " 504", "HTTP 5")):
         return True
@@ -35,7 +69,7 @@ async def _retry_async(
     attempts: int = RETRY_ATTEMPTS,
     base_delay_sec: float = RETRY_BASE_DELAY_SEC,
 ):
-    """Retry an awaitable factory on transient errors with exponential backoff."""
+    """Retry an awaitable factory on transient errors with jittered backoff."""
     last_error = None
     for attempt in range(attempts + 1):
         try:
@@ -44,10 +78,170 @@ async def _retry_async(
             last_error = e
             if attempt == attempts or not _is_transient_error(e):
                 break
-            await asyncio.sleep(base_delay_sec * (2**attempt))
+            # Jitter keeps concurrent clients from retrying in lockstep
+            delay = base_delay_sec * (2**attempt) * random.uniform(0.5, 1.5)
+            await asyncio.sleep(delay)
     raise last_error  # noqa: RSE102
 
 
+class _ProgressLine:
+    """Throttled progress line on stderr, shared by all parts of a transfer."""
+
+    def __init__(self, total_size: int, label: str = "Downloading"):
+        self.total_size = total_size
+        self.label = label
+        self.bytes_done = 0
+        self.last_update = time.monotonic()
+
+    def advance(self, nbytes: int) -> None:
+        self.bytes_done += nbytes
+        if not self.total_size:
+            return
+        # Throttle terminal writes; always show the final value
+        now = time.monotonic()
+        if (
+            now - self.last_update >= PROGRESS_INTERVAL_SEC
+            or self.bytes_done >= self.total_size
+        ):
+            self.last_update = now
+            progress = (self.bytes_done / self.total_size) * 100
+            print(
+                f"\r{self.label}: {progress:.1f}%",
+                end="",
+                flush=True,
+                file=sys.stderr,
+            )
+
+    def finish(self) -> None:
+        if self.total_size:
+            print(file=sys.stderr)  # New line after progress
+
+
+def _content_range(value: str | None) -> tuple[int, int, int | None] | None:
+    """Parse a 'bytes start-end/total' Content-Range header.
+
+    Returns (start, end, total), with total None when the server sent '*',
+    or None if the header is missing or malformed.
+    """
+    if not value or not value.startswith("bytes "):
+        return None
+    span, _, total = value[len("bytes ") :].partition("/")
+    start, _, end = span.strip().partition("-")
+    if not (start.isdigit() and end.isdigit()):
+        return None
+    total = total.strip()
+    return int(start), int(end), int(total) if total.isdigit() else None
+
+
+async def _open_download(session, url: str):
+    """Start a download, probing for byte-range support with the first part.
+
+    Returns the response, the total size (0 if unknown) and whether the bytes
+    after the first part can be fetched as concurrent ranges.
+    """
+    first_range = {"Range": f"bytes=0-{DOWNLOAD_PART_SIZE - 1}"}
+    response = await _retry_async(lambda: session.get(url, headers=first_range))
+    if response.status == 206:
+        content_range = _content_range(response.headers.get("content-range"))
+        if content_range is not None and content_range[2] is not None:
+            start, end, total_size = content_range
+            if (start, end) == (0, min(DOWNLOAD_PART_SIZE, total_size) - 1):
+                return response, total_size, total_size > DOWNLOAD_PART_SIZE
+    if response.status in (206, 416):
+        # Partial content of unknown length or not the slice asked for, or
+        # a range the object cannot satisfy because it is empty; start over
+        # with a plain request
+        response.release()
+        response = await _retry_async(lambda: session.get(url))
+    return response, int(response.headers.get("content-length", 0)), False
+
+
+async def _file_chunks(fd: int, progress) -> AsyncIterator[bytes]:
+    """Yield fd from offset 0 in IO_CHUNK_SIZE pieces, reporting progress."""
+    fadvise = hasattr(os, "posix_fadvise")
+    offset = dropped = 0
+    if fadvise:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    while chunk := await asyncio.to_thread(os.pread, fd, IO_CHUNK_SIZE, offset):
+        offset += len(chunk)
+        progress.advance(len(chunk))
+        yield chunk
+        # The file is read once, so release what was sent from the page cache
+        if fadvise and offset - dropped >= PAGE_CACHE_DROP_INTERVAL:
+            os.posix_fadvise(fd, dropped, offset - dropped, os.POSIX_FADV_DONTNEED)
+            dropped = offset
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve size bytes for fd up front where the platform supports it."""
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as e:
+        # Some filesystems cannot preallocate; writing will still work there
+        if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL):
+            raise
+
+
+def _pwrite_all(fd: int, chunks: list[bytes], offset: int) -> None:
+    """Write chunks to fd at offset in as few syscalls as possible."""
+    data = memoryview(b"".join(chunks))
+    while data:
+        written = os.pwrite(fd, data, offset)
+        data = data[written:]
+        offset += written
+
+
+async def _write_body(response, fd: int, offset: int, progress) -> int:
+    """Stream a response body into fd starting at offset; return its length."""
+    # The network hands over whatever has arrived, often far less than
+    # IO_CHUNK_SIZE; gather it so each disk write moves WRITE_BATCH_SIZE
+    start = offset
+    pending: list[bytes] = []
+    pending_size = 0
+    async for chunk in response.content.iter_chunked(IO_CHUNK_SIZE):
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= WRITE_BATCH_SIZE:
+            await asyncio.to_thread(_pwrite_all, fd, pending, offset)
+            offset += pending_size
+            progress.advance(pending_size)
+            pending, pending_size = [], 0
+    if pending:
+        await asyncio.to_thread(_pwrite_all, fd, pending, offset)
+        offset += pending_size
+        progress.advance(pending_size)
+    return offset - start
+
+
+async def _fetch_range(
+    session, url: str, fd: int, start: int, end: int, progress, semaphore
+) -> None:
+    """Download bytes start..end (inclusive) of url into fd at the same offset."""
+    async with semaphore:
+        headers = {"Range": f"bytes={start}-{end}"}
+        response = await _retry_async(lambda: session.get(url, headers=headers))
+        async with response:
+            if response.status != 206:
+                raise RuntimeError(
+                    f"Failed to download bytes {start}-{end}: HTTP {response.status}"
+                )
+            # Writing at start assumes the body is exactly the slice asked for
+            content_range = response.headers.get("content-range")
+            parsed = _content_range(content_range)
+            if parsed is None or parsed[:2] != (start, end):
+                raise RuntimeError(
+                    f"Failed to download bytes {start}-{end}: "
+                    f"server sent Content-Range {content_range!r}"
+                )
+            received = await _write_body(response, fd, start, progress)
+            if received != end - start + 1:
+                raise RuntimeError(
+                    f"Failed to download bytes {start}-{end}: received {received} bytes"
+                )
+
+
 # Map common file extensions to new create API content types
 # Allowed values: "unspecified", "text", "binary", "gzip", "tar", "tgz"
 CONTENT_TYPE_MAP = {
@@ -91,46 +285,146 @@ MIME_TYPE_MAP = {
 }
 
 
+# Extensions of the archive formats extract_archive understands
+ARCHIVE_EXTENSIONS = (".zip", ".tar.gz", ".tgz", ".zst", ".tar.zst")
+
+# Archive formats extract_stream can unpack while they are downloading
+STREAM_EXTRACT_EXTENSIONS = (".tar.gz", ".tgz", ".zst")
+
+
 def is_archive(file_path: str) -> bool:
     """Check by extension if file is a supported archive type (heuristic)."""
-    return file_path.lower().endswith((".zip", ".tar.gz", ".tgz", ".zst", ".tar.zst"))
+    return file_path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+# Leading bytes of the archive formats recognised without relying on the name
+ZIP_MAGIC = (b"PK\x03\x04", b"PK\x05\x06")
+ZSTD_MAGIC = b"\x28\xb5/\xfd"
+COMPRESSED_TAR_MAGIC = (b"\x1f\x8b", b"BZh", b"\xfd7zXZ\x00")
+# Enough leading bytes to cover the tar header's "ustar" magic
+ARCHIVE_SNIFF_SIZE = 512
 
 
-def _has_zstd_magic(file_path: str) -> bool:
-    """Return True if file begins with zstd magic number."""
+def _is_stream_extractable(archive_name: str, head: bytes) -> bool:
+    """Check the first bytes of a body match the format extract_stream expects."""
+    if archive_name.lower().endswith(".zst"):
+        return head.startswith(ZSTD_MAGIC)
+    # Tar is opened with 'r|*', which also accepts plain and bzip2/xz tars
+    return head.startswith(COMPRESSED_TAR_MAGIC) or head[257:262] == b"ustar"
+
+
+def _sniff_archive(file_path: str) -> str | None:
+    """Identify an archive from its first bytes: "zip", "tar", "zst" or None."""
     try:
         with open(file_path, "rb") as f:
-            head = f.read(4)
-        return head == b"\x28\xb5/\xfd"
-    except Exception:
-        return False
+            head = f.read(ARCHIVE_SNIFF_SIZE)
+    except OSError:
+        return None
+    if head.startswith(ZIP_MAGIC):
+        return "zip"
+    if head[257:262] == b"ustar":
+        return "tar"
+    if head.startswith(ZSTD_MAGIC):
+        return "zst"
+    # gzip/bzip2/xz only show a tar header once decompressed; let tarfile look
+    if head.startswith(COMPRESSED_TAR_MAGIC) and tarfile.is_tarfile(file_path):
+        return "tar"
+    return None
 
 
 def is_extractable(file_path: str) -> bool:
     """Content-aware check whether an archive can be extracted by us."""
-    if zipfile.is_zipfile(file_path):
-        return True
-    if tarfile.is_tarfile(file_path):
-        return True
-    if _has_zstd_magic(file_path):
-        return True
-    return False
+    return _sniff_archive(file_path) is not None
 
 
 def safe_extract_tar(tar_ref, extract_dir: str) -> None:
-    """Safely extract a tar archive to a directory."""
+    """Safely extract a tar archive to a directory.
 
-    def is_within_directory(directory, target):
-        abs_directory = os.path.abspath(directory)
-        abs_target = os.path.abspath(target)
-        prefix = os.path.commonprefix([abs_directory, abs_target])
-        return prefix == abs_directory
+    Members are checked as they are read, so streaming ("r|") tarfiles work too.
+    """
 
-    for member in tar_ref.getmembers():
-        member_path = os.path.join(extract_dir, member.name)
-        if not is_within_directory(extract_dir, member_path):
+    abs_directory = os.path.abspath(extract_dir)
+
+    def member_filter(member, path):
+        member_path = os.path.abspath(os.path.join(abs_directory, member.name))
+        # Compare whole path components so "out2/x" does not pass for "out"
+        if os.path.commonpath([abs_directory, member_path]) != abs_directory:
             raise RuntimeError("Attempted path traversal in tar file")
-    tar_ref.extractall(extract_dir, filter="data")
+        return tarfile.data_filter(member, path)
+
+    tar_ref.extractall(extract_dir, filter=member_filter)
+
+
+def extract_zip(archive_path: str, extract_dir: str) -> None:
+    """Extract a zip archive, inflating members on a thread pool.
+
+    zlib releases the GIL while inflating, so members are split across workers
+    that each open their own ZipFile handle (ZipFile reads are not thread-safe).
+    """
+    with zipfile.ZipFile(archive_path, "r") as zip_ref:
+        members = sorted(zip_ref.infolist(), key=lambda m: m.file_size, reverse=True)
+    workers = min(os.cpu_count() or 1, len(members))
+    if workers <= 1:
+        with zipfile.ZipFile(archive_path, "r") as zip_ref:
+            zip_ref.extractall(extract_dir)
+        return
+
+    def extract_members(batch):
+        with zipfile.ZipFile(archive_path, "r") as zip_ref:
+            for member in batch:
+                try:
+                    zip_ref.extract(member, extract_dir)
+                except FileExistsError:
+                    # Another worker created the same parent directory first
+                    zip_ref.extract(member, extract_dir)
+
+    # Deal members round-robin by size so the workers get similar amounts
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(extract_members, [members[i::workers] for i in range(workers)]))
+
+
+def extract_stream(stream, archive_name: str, extract_dir: str) -> None:
+    """Extract a tar or zstd archive read sequentially from stream.
+
+    The format comes from archive_name; the stream is never seeked, so it
+    may be a pipe fed by a download still in progress.
+    """
+    name_lower = archive_name.lower()
+    if name_lower.endswith((".tar.gz", ".tgz")):
+        # Detect the compression from the data, so a mislabelled plain or
+        # bzip2 tar still extracts
+        with tarfile.open(fileobj=stream, mode="r|*") as tar:
+            safe_extract_tar(tar, extract_dir)
+        return
+
+    if not name_lower.endswith(".zst"):
+        raise RuntimeError(f"Cannot stream-extract {archive_name}")
+    dctx = zstandard.ZstdDecompressor(max_window_size=ZSTD_MAX_WINDOW_SIZE)
+
+    # Decompress straight into a streaming tar reader; no temporary .tar.
+    # Multi-frame output (zstd -T, pzstd) must read on past each frame end
+    if name_lower.endswith(".tar.zst"):
+        with dctx.stream_reader(
+            stream, read_size=ZSTD_BUFFER_SIZE, read_across_frames=True
+        ) as reader:
+            with tarfile.open(
+                fileobj=reader, mode="r|", bufsize=ZSTD_BUFFER_SIZE
+            ) as tar:
+                safe_extract_tar(tar, extract_dir)
+        return
+
+    # Single-file zst compression
+    output_name = os.path.splitext(os.path.basename(archive_name))[0]
+    os.makedirs(extract_dir, exist_ok=True)  # Create the extraction directory
+    # Decompress into one reused buffer rather than a new bytes per block
+    buffer = bytearray(ZSTD_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(os.path.join(extract_dir, output_name), "wb") as decompressed:
+        with dctx.stream_reader(
+            stream, read_size=ZSTD_BUFFER_SIZE, read_across_frames=True
+        ) as reader:
+            while size := reader.readinto(buffer):
+                decompressed.write(view[:size])
 
 
 def extract_archive(archive_path: str, extract_dir: str) -> None:
@@ -138,57 +432,33 @@ def extract_archive(archive_path: str, extract_dir: str) -> None:
     path_lower = archive_path.lower()
 
     # Prefer content-based detection first
-    if zipfile.is_zipfile(archive_path):
-        with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            zip_ref.extractall(extract_dir)
+    kind = _sniff_archive(archive_path)
+    if kind == "zip":
+        extract_zip(archive_path, extract_dir)
         return
 
-    if tarfile.is_tarfile(archive_path):
+    if kind == "tar":
         with tarfile.open(archive_path, "r:*") as tar_ref:
             safe_extract_tar(tar_ref, extract_dir)
         return
 
     # Handle ZIP files
     if path_lower.endswith(".zip"):
-        with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            zip_ref.extractall(extract_dir)
+        extract_zip(archive_path, extract_dir)
 
     # Handle tar.gz and tgz files
     elif path_lower.endswith((".tar.gz", ".tgz")):
         with tarfile.open(archive_path, "r:gz") as tar_ref:
             safe_extract_tar(tar_ref, extract_dir)
 
-    # Handle tar.zst files
-    elif path_lower.endswith(".tar.zst"):
-        # First decompress to a temporary tar file
-        temp_tar = archive_path + ".tar"
-        try:
-            if not _has_zstd_magic(archive_path):
-                raise RuntimeError("File does not appear to be zstd-compressed")
-            dctx = zstandard.ZstdDecompressor()
-            with open(archive_path, "rb") as compressed:
-                with open(temp_tar, "wb") as decompressed:
-                    dctx.copy_stream(compressed, decompressed)
-
-            # Now extract the tar file
-            with tarfile.open(temp_tar, "r:") as tar:
-                safe_extract_tar(tar, extract_dir)
-        finally:
-            # Clean up temporary tar file
-            if os.path.exists(temp_tar):
-                os.unlink(temp_tar)
-
-    # Handle single-file zst compression
+    # Handle tar.zst and single-file zst compression
     elif path_lower.endswith(".zst"):
-        dctx = zstandard.ZstdDecompressor()
-        output_name = os.path.splitext(os.path.basename(archive_path))[0]
-        output_path = os.path.join(extract_dir, output_name)
-        os.makedirs(extract_dir, exist_ok=True)  # Create the extraction directory
-        if not _has_zstd_magic(archive_path):
+        if kind != "zst":
             raise RuntimeError("File does not appear to be zstd-compressed")
         with open(archive_path, "rb") as compressed:
-            with open(output_path, "wb") as decompressed:
-                dctx.copy_stream(compressed, decompressed)
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(compressed.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            extract_stream(compressed, archive_path, extract_dir)
 
 
 def detect_content_type(file_path: str) -> str:
@@ -200,76 +470,66 @@ def detect_content_type(file_path: str) -> str:
     Returns:
         str: Object create content type enum: 'unspecified' | 'text' | 'gzip' | 'tar' | 'tgz'
     """
-    # Handle multi-part archive extensions first
-    lower = file_path.lower()
-    if lower.endswith(".tar.gz") or lower.endswith(".tgz"):
-        return "tgz"
+    stem, ext = os.path.splitext(os.path.basename(file_path).lower())
 
-    # Get the file extension (lowercase) for single-part extensions
-    ext = os.path.splitext(file_path)[1].lower()
-
-    # Check our custom mapping first
-    if ext in CONTENT_TYPE_MAP:
-        return CONTENT_TYPE_MAP[ext]
+    # Multi-part extensions such as ".tar.gz" take precedence over the last one
+    double_ext = os.path.splitext(stem)[1] + ext
+    if double_ext in CONTENT_TYPE_MAP:
+        return CONTENT_TYPE_MAP[double_ext]
 
     # For unknown types, default to binary per new API enum
-    return "unspecified"
+    return CONTENT_TYPE_MAP.get(ext, "unspecified")
+
+
+# Filters forwarded from `rl object list` to the objects list endpoints
+LIST_FILTER_KEYS = (
+    "limit",
+    "starting_after",
+    "name",
+    "content_type",
+    "state",
+    "search",
+)
+LIST_HEADERS = ["ID", "Name", "Type", "State", "Size"]
+SIZE_UNITS = ("B", "KB", "MB", "GB")
+
+
+def _format_size(size_bytes: int | None) -> str:
+    """Format a byte count in human-readable form, e.g. "1.5 MB"."""
+    if size_bytes is None:
+        return "N/A"
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    unit = min(max((size_bytes.bit_length() - 1) // 10, 0), len(SIZE_UNITS) - 1)
+    if unit == 0:
+        return f"{size_bytes} B"
+    return f"{size_bytes / (1 << (unit * 10)):.1f} {SIZE_UNITS[unit]}"
 
 
 async def list_objects(args) -> None:
     """List objects with optional filtering."""
-    params = {}
-
-    if hasattr(args, "limit"):
-        params["limit"] = args.limit
-    if hasattr(args, "starting_after"):
-        params["starting_after"] = args.starting_after
-    if hasattr(args, "name"):
-        params["name"] = args.name
-    if hasattr(args, "content_type"):
-        params["content_type"] = args.content_type
-    if hasattr(args, "state"):
-        params["state"] = args.state
-    if hasattr(args, "search"):
-        params["search"] = args.search
-    if hasattr(args, "is_public") and args.is_public:
+    opts = vars(args)
+    params = {key: opts[key] for key in LIST_FILTER_KEYS if opts.get(key) is not None}
+    if opts.get("is_public"):
         params["is_public"] = True
 
     # Use the public endpoint if specified
-    if hasattr(args, "public") and args.public:
-        objects = await runloop_api_client().objects.list_public(**params)
+    client = runloop_api_client()
+    if opts.get("public"):
+        objects = await client.objects.list_public(**params)
     else:
-        objects = await runloop_api_client().objects.list(**params)
-
-    # Convert objects to a list of dictionaries for tabulate
-    table_data = []
-    for obj in objects.objects:
-        # Format size in human-readable format
-        size = "N/A"
-        if obj.size_bytes is not None:
-            if obj.size_bytes < 1024:
-                size = f"{obj.size_bytes} B"
-            elif obj.size_bytes < 1024 * 1024:
-                size = f"{obj.size_bytes / 1024:.1f} KB"
-            else:
-                size = f"{obj.size_bytes / (1024 * 1024):.1f} MB"
-
-        table_data.append(
-            {
-                "ID": obj.id,
-                "Name": obj.name,
-                "Type": obj.content_type,
-                "State": obj.state,
-                "Size": size,
-            }
-        )
+        objects = await client.objects.list(**params)
+
+    table_data = [
+        [obj.id, obj.name, obj.content_type, obj.state, _format_size(obj.size_bytes)]
+        for obj in objects.objects
+    ]
 
     if not table_data:
         print("No objects found.")
         return
 
     # Print the table
-    print(tabulate(table_data, headers="keys", tablefmt="grid"))
+    print(tabulate(table_data, headers=LIST_HEADERS, tablefmt="grid"))
 
 
 async def get(args) -> None:
@@ -279,151 +539,281 @@ async def get(args) -> None:
     print(f"object={object.model_dump_json(indent=4)}")
 
 
+async def _check_download_status(response) -> None:
+    """Raise RuntimeError unless response carries (part of) the object."""
+    if response.status not in (200, 206):
+        try:
+            error_text = await response.text()
+        except Exception:
+            error_text = ""
+        raise RuntimeError(
+            f"Failed to download file: HTTP {response.status} {error_text}"
+        )
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, continuing after short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _extract_fd(read_fd: int, archive_name: str, extract_dir: str) -> None:
+    """Run extract_stream over the pipe read_fd, closing it when done."""
+    with open(read_fd, "rb", buffering=IO_CHUNK_SIZE) as stream:
+        extract_stream(stream, archive_name, extract_dir)
+
+
+async def _read_head(chunks, size: int) -> bytes:
+    """Read at least size bytes from the async iterator chunks, less at its end."""
+    head = b""
+    while len(head) < size and (chunk := await anext(chunks, b"")):
+        head += chunk
+    return head
+
+
+async def _prepend(head: bytes, chunks):
+    """Yield head, then the rest of chunks."""
+    if head:
+        yield head
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _extract_response(
+    chunks, archive_name: str, extract_dir: str, progress
+) -> None:
+    """Extract a body, given as an async iterator of chunks, while it arrives."""
+    # The body goes through a pipe to extract_stream on a worker thread, so
+    # decompression and disk writes overlap with the network transfer
+    read_fd, write_fd = os.pipe()
+    extraction = asyncio.ensure_future(
+        asyncio.to_thread(_extract_fd, read_fd, archive_name, extract_dir)
+    )
+    try:
+        async for chunk in chunks:
+            try:
+                await asyncio.to_thread(_write_all, write_fd, chunk)
+            except BrokenPipeError:
+                # The extractor stopped reading; its outcome is awaited below
+                break
+            progress.advance(len(chunk))
+    except BaseException:
+        # Let the extractor reach end of input before reporting the failure
+        os.close(write_fd)
+        await asyncio.gather(extraction, return_exceptions=True)
+        raise
+    os.close(write_fd)
+    progress.finish()
+    await extraction
+
+
+async def _extract_into(extract_dir: str, extract) -> None:
+    """Await extract(staging_dir), then swap the staging dir into extract_dir.
+
+    Extraction goes into a staging directory beside the target, so a failure
+    keeps the previous contents of extract_dir.
+    """
+    # A fresh work dir per run holds the staging dir and, during the swap,
+    # the previous contents; leftovers from a killed run never collide
+    parent_dir, name = os.path.split(extract_dir)
+    await asyncio.to_thread(os.makedirs, parent_dir, exist_ok=True)
+    work_dir = await asyncio.to_thread(
+        tempfile.mkdtemp, prefix=f"{name}.tmp.", dir=parent_dir
+    )
+    staging_dir = os.path.join(work_dir, "new")
+    old_dir = os.path.join(work_dir, "old")
+    try:
+        # Created normally, so the result gets the usual umask permissions
+        await asyncio.to_thread(os.mkdir, staging_dir)
+        print(f"Extracting archive to {extract_dir}...")
+        await extract(staging_dir)
+
+        had_old = os.path.lexists(extract_dir)
+        if had_old:
+            os.replace(extract_dir, old_dir)
+        try:
+            os.replace(staging_dir, extract_dir)
+        except OSError:
+            # Put the previous contents back rather than leave the target missing
+            if had_old:
+                os.replace(old_dir, extract_dir)
+            raise
+        print(f"Successfully extracted to {extract_dir}")
+    finally:
+        await asyncio.to_thread(shutil.rmtree, work_dir, ignore_errors=True)
+
+
+async def _download_and_extract(
+    download_url: str, archive_name: str, extract_dir: str
+) -> bool:
+    """Download a tar or zstd archive and extract it without a local copy.
+
+    Returns False, having extracted nothing, if the body does not start like
+    the format archive_name suggests.
+    """
+    async with aiohttp.ClientSession(timeout=TRANSFER_TIMEOUT) as session:
+        try:
+            response = await _retry_async(lambda: session.get(download_url))
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"Network error during download: {str(e)}")
+
+        async with response:
+            await _check_download_status(response)
+            chunks = response.content.iter_chunked(IO_CHUNK_SIZE)
+            head = await _read_head(chunks, ARCHIVE_SNIFF_SIZE)
+            if not _is_stream_extractable(archive_name, head):
+                return False
+            progress = _ProgressLine(int(response.headers.get("content-length", 0)))
+            await _extract_into(
+                extract_dir,
+                lambda staging_dir: _extract_response(
+                    _prepend(head, chunks), archive_name, staging_dir, progress
+                ),
+            )
+    return True
+
+
 async def download(args) -> None:
     """Download an object to a local file and optionally extract it."""
     assert args.id is not None
     assert args.path is not None
 
-    # Ensure we pick up the patched client in tests and latest env
-    try:
-        runloop_api_client.cache_clear()
-    except Exception:
-        pass
+    client = runloop_api_client()
 
     # Get the object metadata first
-    object = await runloop_api_client().objects.retrieve(args.id)
+    object = await client.objects.retrieve(args.id)
 
     # Get the download URL
-    duration_seconds = (
-        args.duration_seconds if hasattr(args, "duration_seconds") else 3600
-    )
-    download_url_response = await runloop_api_client().objects.download(
-        args.id, duration_seconds=duration_seconds
+    download_url_response = await client.objects.download(
+        args.id, duration_seconds=args.duration_seconds
     )
     download_url = download_url_response.download_url
 
     # Determine the download path
-    if getattr(args, "extract", False):
+    if args.extract:
         # When extracting, download to a temporary file first with correct extension
-        # Prefer extension from object name
-        ext = None
         name = object.name
-        if inspect.isawaitable(name):
+        if not isinstance(name, str) and inspect.isawaitable(name):
             name = await name
-        if isinstance(name, str) and name:
-            name_lower = name.lower()
-            if name_lower.endswith((".tar.gz", ".tar.zst")):
-                ext = "." + ".".join(name_lower.split(".")[-2:])
-            else:
-                ext = os.path.splitext(name)[1]
-
-        # Fallback: derive from content type
-        if not ext:
-            content_type = object.content_type
-            if inspect.isawaitable(content_type):
-                content_type = await content_type
-            ext = MIME_TYPE_MAP.get(content_type)
-
-        # Decide filename: use object.name only for archives
-        archive_exts = (".zip", ".tar.gz", ".tgz", ".zst", ".tar.zst")
-        is_archive_ext = False
-        base_name_candidate = None
-        if isinstance(name, str) and name:
-            base_name_candidate = os.path.basename(name)
-            name_lower = name.lower()
-            is_archive_ext = name_lower.endswith(archive_exts)
-        else:
-            # fall back to ext check only
-            if ext in archive_exts:
-                is_archive_ext = True
+        if not isinstance(name, str):
+            name = ""
 
-        if is_archive_ext and base_name_candidate:
-            temp_basename = base_name_candidate
+        if name.lower().endswith(ARCHIVE_EXTENSIONS):
+            # Archives keep their own name so the format stays recognisable
+            temp_basename = os.path.basename(name)
         else:
-            # id-based temp name, ensure ext appended if present
-            temp_basename = f"rl_cli_download_{args.id}"
-            if ext and not temp_basename.lower().endswith(ext.lower()):
-                temp_basename += ext
+            # Prefer extension from object name, then from content type
+            ext = os.path.splitext(name)[1]
+            if not ext:
+                content_type = object.content_type
+                if not isinstance(content_type, str) and inspect.isawaitable(
+                    content_type
+                ):
+                    content_type = await content_type
+                ext = MIME_TYPE_MAP.get(content_type) or ""
+            temp_basename = f"rl_cli_download_{args.id}{ext}"
+
+        # Tar and zstd archives are unpacked as they arrive; zip needs the
+        # whole file on disk first because its index sits at the end
+        if temp_basename.lower().endswith(STREAM_EXTRACT_EXTENSIONS):
+            if await _download_and_extract(
+                download_url, temp_basename, os.path.abspath(args.path)
+            ):
+                return
+            # Not the format its name suggests; fetch it to disk, where
+            # extract_archive identifies it from its content
 
         download_path = os.path.join(tempfile.gettempdir(), temp_basename)
     else:
         # When not extracting, use the specified path
         download_path = os.path.abspath(args.path)
-        os.makedirs(os.path.dirname(download_path), exist_ok=True)
+        await asyncio.to_thread(
+            os.makedirs, os.path.dirname(download_path), exist_ok=True
+        )
 
     # Download the file
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(timeout=TRANSFER_TIMEOUT) as session:
         try:
-            response = await _retry_async(lambda: session.get(download_url))
+            response, total_size, ranged = await _open_download(session, download_url)
         except aiohttp.ClientError as e:
             raise RuntimeError(f"Network error during download: {str(e)}")
 
-        if response.status != 200:
-            try:
-                error_text = await response.text()
-            except Exception:
-                error_text = ""
-            try:
-                response.close()
-            finally:
-                pass
-            raise RuntimeError(
-                f"Failed to download file: HTTP {response.status} {error_text}"
-            )
-
-        # Get total size for progress reporting
-        total_size = int(response.headers.get("content-length", 0))
+        async with response:
+            await _check_download_status(response)
+            progress = _ProgressLine(total_size)
 
-        # Open file and write chunks
-        try:
-            with open(download_path, "wb") as f:
-                bytes_downloaded = 0
-                async for chunk in response.content.iter_chunked(8192):
-                    f.write(chunk)
-                    bytes_downloaded += len(chunk)
+            # Writes run in a worker thread so the next chunk keeps arriving
+            # while the previous one hits the disk. When the server honours
+            # byte ranges, the rest of the object is fetched concurrently and
+            # each part is written at its own offset.
+            try:
+                with open(download_path, "wb") as f:
+                    fd = f.fileno()
+                    parts = [_write_body(response, fd, 0, progress)]
                     if total_size:
-                        progress = (bytes_downloaded / total_size) * 100
-                        print(
-                            f"\rDownloading: {progress:.1f}%",
-                            end="",
-                            flush=True,
-                            file=sys.stderr,
+                        # Reserve the whole file first so it is laid out in
+                        # few extents even when parts land out of order
+                        _preallocate(fd, total_size)
+                    if ranged:
+                        semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+                        parts.extend(
+                            _fetch_range(
+                                session,
+                                download_url,
+                                fd,
+                                part_start,
+                                min(part_start + DOWNLOAD_PART_SIZE, total_size) - 1,
+                                progress,
+                                semaphore,
+                            )
+                            for part_start in range(
+                                DOWNLOAD_PART_SIZE, total_size, DOWNLOAD_PART_SIZE
+                            )
                         )
-
-                if total_size:
-                    print(file=sys.stderr)  # New line after progress
-        except OSError as e:
-            raise RuntimeError(f"Failed to write downloaded file: {str(e)}")
+                    tasks = [asyncio.ensure_future(part) for part in parts]
+                    try:
+                        await asyncio.gather(*tasks)
+                    except BaseException:
+                        # Stop the remaining parts before the file is closed
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                        raise
+                    if ranged and progress.bytes_done != total_size:
+                        # Every part has its own offset, so a gap is corruption
+                        raise RuntimeError(
+                            f"Failed to download file: received "
+                            f"{progress.bytes_done} of {total_size} bytes"
+                        )
+                    if progress.bytes_done < total_size:
+                        # A decoded single-stream body can come out shorter
+                        # than Content-Length
+                        os.ftruncate(fd, progress.bytes_done)
+                    progress.finish()
+            except OSError as e:
+                raise RuntimeError(f"Failed to write downloaded file: {str(e)}")
 
     # Print download path only when not extracting
-    if not getattr(args, "extract", False):
+    if not args.extract:
         print(f"Downloaded object to {download_path}")
 
     # Handle extraction if requested
-    if getattr(args, "extract", False):
+    if args.extract:
         if not is_archive(download_path):
             raise RuntimeError(
                 "--extract specified but file is not a supported archive type"
             )
 
         # When --extract is used, args.path specifies the target extraction directory
-        extract_dir = os.path.abspath(args.path)
-
-        # Create fresh extraction directory
-        if os.path.exists(extract_dir):
-            shutil.rmtree(extract_dir)
-        os.makedirs(extract_dir)
-
-        try:
-            print(f"Extracting archive to {extract_dir}...")
-            extract_archive(download_path, extract_dir)
-            print(f"Successfully extracted to {extract_dir}")
-            # Clean up the downloaded archive since we've extracted it
-            os.unlink(download_path)
-        except Exception:
-            # Clean up extraction directory on failure
-            shutil.rmtree(extract_dir)
-            raise
+        await _extract_into(
+            os.path.abspath(args.path),
+            lambda staging_dir: asyncio.to_thread(
+                extract_archive, download_path, staging_dir
+            ),
+        )
+        # Clean up the downloaded archive since we've extracted it
+        await asyncio.to_thread(os.unlink, download_path)
 
 
 async def delete(args) -> None:
@@ -432,15 +822,11 @@ async def delete(args) -> None:
     This action is irreversible and will remove the object and all its metadata.
     """
     assert args.id is not None
-    # Ensure latest env/key is used
-    try:
-        runloop_api_client.cache_clear()
-    except Exception:
-        pass
+    client = runloop_api_client()
 
     try:
         # Delete the object
-        deleted_object = await runloop_api_client().objects.delete(args.id)
+        deleted_object = await client.objects.delete(args.id)
         print(f"Successfully deleted object {args.id}")
 
         # Print object details
@@ -459,18 +845,12 @@ async def upload(args) -> None:
     """
     assert args.path is not None
     assert args.name is not None
-    # Ensure latest env/key is used
-    try:
-        runloop_api_client.cache_clear()
-    except Exception:
-        pass
+    client = runloop_api_client()
 
-    # Check if file exists and is accessible
+    # Open the file once up front; every upload attempt streams from this fd
     try:
         file_path = os.path.abspath(args.path)
-        file_size = os.path.getsize(file_path)
-        with open(file_path, "rb") as _:
-            pass  # Just testing if we can open the file
+        file = await asyncio.to_thread(open, file_path, "rb")
     except FileNotFoundError:
         raise RuntimeError(f"File not found: {args.path}")
     except PermissionError:
@@ -479,19 +859,18 @@ async def upload(args) -> None:
         raise RuntimeError(f"Error accessing file: {args.path} - {str(e)}")
 
     try:
+        fd = file.fileno()
+        file_size = os.fstat(fd).st_size
+
         # Step 1: Create the object (initial state: UPLOADING)
         # Detect content type from file extension if not provided
-        content_type = (
-            args.content_type
-            if hasattr(args, "content_type") and args.content_type
-            else detect_content_type(args.path)
-        )
+        content_type = args.content_type or detect_content_type(args.path)
         # Normalize to allowed enum values; default to 'unspecified' if not recognized
         if content_type not in ("unspecified", "text", "gzip", "tar", "tgz"):
             content_type = "unspecified"
         print(f"Using content type: {content_type}")
 
-        create_response = await runloop_api_client().objects.create(
+        create_response = await client.objects.create(
             name=args.name, content_type=content_type
         )
         object_id = create_response.id
@@ -499,62 +878,36 @@ async def upload(args) -> None:
 
         # Step 2: Upload the file using the provided upload URL
         upload_url = create_response.upload_url
-        async with aiohttp.ClientSession() as session:
-            # Open and upload the file with progress tracking
-            with open(file_path, "rb") as f:
-                print(f"Uploading {args.path} ({file_size} bytes)...", file=sys.stderr)
-
-                # Create a progress tracking reader
-                class ProgressReader(io.BufferedReader):
-                    def __init__(self, file_path, total_size):
-                        super().__init__(open(file_path, "rb"))
-                        self.total_size = total_size
-                        self.bytes_read = 0
-
-                    def read(self, size=-1):
-                        chunk = super().read(size)
-                        if chunk:
-                            self.bytes_read += len(chunk)
-                            progress = (self.bytes_read / self.total_size) * 100
-                            print(
-                                f"\rProgress: {progress:.1f}%",
-                                end="",
-                                flush=True,
-                                file=sys.stderr,
-                            )
-                        return chunk
-
-                # Create a progress reader (close the original file as we'll reopen it)
-                f.close()
-                reader = ProgressReader(file_path, file_size)
-
+        async with aiohttp.ClientSession(timeout=TRANSFER_TIMEOUT) as session:
+            print(f"Uploading {args.path} ({file_size} bytes)...", file=sys.stderr)
+
+            # Perform the upload (PUT request as required by server); each
+            # attempt streams the file from the start through a new generator
+            headers = {"Content-Length": str(file_size)}  # Required for some servers
+            response = await _retry_async(
+                lambda: session.put(
+                    upload_url,
+                    data=_file_chunks(fd, _ProgressLine(file_size, "Progress")),
+                    headers=headers,
+                )
+            )
+            if response.status not in (200, 201, 204):
                 try:
-                    # Perform the upload (PUT request as required by server)
-                    headers = {
-                        "Content-Length": str(file_size)
-                    }  # Required for some servers
-                    response = await _retry_async(
-                        lambda: session.put(upload_url, data=reader, headers=headers)
-                    )
-                    if response.status not in (200, 201, 204):
-                        try:
-                            error_text = await response.text()
-                        except Exception:
-                            error_text = ""
-                        try:
-                            response.close()
-                        finally:
-                            pass
-                        raise RuntimeError(
-                            f"Upload failed with status {response.status}: {error_text}"
-                        )
-                    print("\nUpload completed successfully.")
+                    error_text = await response.text()
+                except Exception:
+                    error_text = ""
+                try:
+                    response.close()
                 finally:
-                    reader.close()  # Ensure we close the file
+                    pass
+                raise RuntimeError(
+                    f"Upload failed with status {response.status}: {error_text}"
+                )
+            print("\nUpload completed successfully.")
 
         # Step 3: Complete the upload (transition to READ_ONLY state)
         try:
-            await runloop_api_client().objects.complete(object_id)
+            await client.objects.complete(object_id)
             print(f"Object {object_id} ({args.name}) transitioned to READ_ONLY state")
         except Exception as e:
             print(
@@ -569,3 +922,5 @@ async def upload(args) -> None:
         raise RuntimeError(f"Network error during upload: {str(e)}")
     except Exception as e:
         raise RuntimeError(f"Error during upload: {str(e)}")
+    finally:
+        file.close()
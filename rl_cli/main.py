@@ -4,21 +4,48 @@ import argparse
 import asyncio
 import os
 import sys
+import threading
 
 from . import __version__
-from .utils import (
-    get_latest_version,
-    update_check_cache,
-    should_check_for_updates,
-    _parse_env_arg,
-    _parse_code_mounts,
-    _parse_user,
+
+# Command modules and .utils pull in the Runloop SDK (httpx, pydantic), so
+# they are imported inside the functions that need them; `rl --version`,
+# `rl -h` and each single command only pay for what they use
+
+try:
+    import uvloop
+except ImportError:  # optional; the stdlib event loop is used without it
+    uvloop = None
+
+# Allowed values for arguments shared by several parsers
+RESOURCE_CHOICES = ("X_SMALL", "SMALL", "MEDIUM", "LARGE", "X_LARGE", "XX_LARGE")
+ARCHITECTURE_CHOICES = ("arm64", "x86_64")
+IDLE_ACTION_CHOICES = ("shutdown", "suspend")
+DEVBOX_STATUS_CHOICES = (
+    "initializing",
+    "running",
+    "suspending",
+    "suspended",
+    "resuming",
+    "failure",
+    "shutdown",
 )
-from .commands import devbox, blueprint, object
+STDIN_SIGNAL_CHOICES = ("EOF", "INTERRUPT")
+OBJECT_STATE_CHOICES = ("UPLOADING", "READ_ONLY", "DELETED")
+CONTENT_TYPE_CHOICES = ("unspecified", "text", "binary", "gzip", "tar", "tgz")
+
+# Top-level commands and their one-line help
+COMMAND_HELP = {
+    "devbox": "Manage devboxes",
+    "blueprint": "Manage blueprints",
+    "object": "Manage objects",
+}
 
 
 def check_for_updates():
     """Check for available updates."""
+    from .utils import get_latest_version, should_check_for_updates, update_check_cache
+
     if not should_check_for_updates():
         return
 
@@ -29,17 +56,28 @@ def check_for_updates():
 
     current_version = __version__
     if latest_version != current_version:
+        # One write, so the notice is not split by the command's own output
         print(
-            f"Update available: rl-cli {latest_version} (current: {current_version})",
+            f"Update available: rl-cli {latest_version} (current: {current_version})\n"
+            "Run 'uv tool upgrade rl-cli' to update",
             file=sys.stderr,
         )
-        print("Run 'uv tool upgrade rl-cli' to update", file=sys.stderr)
 
     update_check_cache()
 
 
+def _check_for_updates_quietly():
+    """Run check_for_updates, ignoring any failure."""
+    try:
+        check_for_updates()
+    except Exception:
+        pass  # Silently ignore update check failures
+
+
 async def update_check_command(args) -> None:
     """Command to manually check for updates."""
+    from .utils import get_latest_version, update_check_cache
+
     latest_version = get_latest_version()
     if latest_version is None:
         print("Unable to check for updates")
@@ -55,16 +93,56 @@ async def update_check_command(args) -> None:
     update_check_cache()
 
 
+def _add_launch_arguments(parser):
+    """Add the resource and user options shared by devbox and blueprint create."""
+    from .utils import _parse_user
+
+    parser.add_argument(
+        "--resources",
+        type=str,
+        help="Resource size",
+        choices=RESOURCE_CHOICES,
+    )
+    parser.add_argument(
+        "--architecture",
+        type=str,
+        help="Architecture (default: arm64)",
+        choices=ARCHITECTURE_CHOICES,
+    )
+    parser.add_argument(
+        "--root",
+        action="store_true",
+        help="Run as root",
+    )
+    parser.add_argument(
+        "--user", type=_parse_user, metavar="USER:UID", help="Run as this user"
+    )
+
+
 def setup_devbox_parser(subparsers):
     """Setup the devbox command parser."""
-    parser = subparsers.add_parser("devbox", help="Manage devboxes")
+    from .commands import devbox
+    from .utils import _parse_code_mounts, _parse_env_arg
+
+    parser = subparsers.add_parser("devbox", help=COMMAND_HELP["devbox"])
     subparsers = parser.add_subparsers(dest="subcommand")
 
+    # --id shared by every subcommand that acts on an existing devbox
+    id_parent = argparse.ArgumentParser(add_help=False)
+    id_parent.add_argument("--id", required=True, help="Devbox ID")
+
+    # --refresh-key shared by the subcommands that connect over SSH
+    refresh_key_parent = argparse.ArgumentParser(add_help=False)
+    refresh_key_parent.add_argument(
+        "--refresh-key",
+        dest="refresh_key",
+        action="store_true",
+        help="Request a new SSH key instead of reusing a recently cached one",
+    )
+
     # Create
     create_parser = subparsers.add_parser("create", help="Create a devbox")
-    create_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.create(args))
-    )
+    create_parser.set_defaults(func=devbox.create)
     create_parser.add_argument(
         "--launch_commands",
         help="Devbox initialization commands",
@@ -94,48 +172,19 @@ def setup_devbox_parser(subparsers):
     create_parser.add_argument(
         "--idle_action",
         type=str,
-        choices=["shutdown", "suspend"],
+        choices=IDLE_ACTION_CHOICES,
         help="Action on idle",
     )
-    create_parser.add_argument(
-        "--resources",
-        type=str,
-        help="Resource size",
-        choices=["X_SMALL", "SMALL", "MEDIUM", "LARGE", "X_LARGE", "XX_LARGE"],
-    )
-    create_parser.add_argument(
-        "--architecture",
-        type=str,
-        help="Architecture (default: arm64)",
-        choices=["arm64", "x86_64"],
-    )
-    create_parser.add_argument(
-        "--root",
-        action="store_true",
-        help="Run as root",
-    )
-    create_parser.add_argument(
-        "--user", type=_parse_user, metavar="USER:UID", help="Run as this user"
-    )
+    _add_launch_arguments(create_parser)
 
     # List
     list_parser = subparsers.add_parser("list", help="List devboxes")
-    list_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.list_devboxes(args))
-    )
+    list_parser.set_defaults(func=devbox.list_devboxes)
     list_parser.add_argument(
         "--status",
         type=str,
         help="Filter by status",
-        choices=[
-            "initializing",
-            "running",
-            "suspending",
-            "suspended",
-            "resuming",
-            "failure",
-            "shutdown",
-        ],
+        choices=DEVBOX_STATUS_CHOICES,
     )
     list_parser.add_argument(
         "--limit",
@@ -145,16 +194,14 @@ def setup_devbox_parser(subparsers):
     )
 
     # Get
-    get_parser = subparsers.add_parser("get", help="Get devbox")
-    get_parser.set_defaults(func=lambda args: asyncio.create_task(devbox.get(args)))
-    get_parser.add_argument("--id", required=True, help="Devbox ID")
+    get_parser = subparsers.add_parser("get", help="Get devbox", parents=[id_parent])
+    get_parser.set_defaults(func=devbox.get)
 
     # Exec (synchronous)
-    exec_parser = subparsers.add_parser("exec", help="Execute a command on a devbox")
-    exec_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.execute(args))
+    exec_parser = subparsers.add_parser(
+        "exec", help="Execute a command on a devbox", parents=[id_parent]
     )
-    exec_parser.add_argument("--id", required=True, help="Devbox ID")
+    exec_parser.set_defaults(func=devbox.execute)
     exec_parser.add_argument("--command", required=True, help="Command to execute")
     exec_parser.add_argument(
         "--shell_name", required=False, help="Shell name to use (optional)"
@@ -162,12 +209,11 @@ def setup_devbox_parser(subparsers):
 
     # Exec (asynchronous)
     exec_async_parser = subparsers.add_parser(
-        "exec_async", help="Execute a command asynchronously on a devbox"
+        "exec_async",
+        help="Execute a command asynchronously on a devbox",
+        parents=[id_parent],
     )
-    exec_async_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.execute_async(args))
-    )
-    exec_async_parser.add_argument("--id", required=True, help="Devbox ID")
+    exec_async_parser.set_defaults(func=devbox.execute_async)
     exec_async_parser.add_argument(
         "--command", required=True, help="Command to execute"
     )
@@ -177,57 +223,52 @@ def setup_devbox_parser(subparsers):
 
     # Get async execution status
     get_async_parser = subparsers.add_parser(
-        "get_async", help="Get status of an async execution"
-    )
-    get_async_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.get_async_exec(args))
+        "get_async", help="Get status of an async execution", parents=[id_parent]
     )
-    get_async_parser.add_argument("--id", required=True, help="Devbox ID")
+    get_async_parser.set_defaults(func=devbox.get_async_exec)
     get_async_parser.add_argument("--execution_id", required=True, help="Execution ID")
 
     # Send stdin to async execution
     send_stdin_parser = subparsers.add_parser(
-        "send_stdin", help="Send stdin to a running async execution"
-    )
-    send_stdin_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.send_stdin(args))
+        "send_stdin",
+        help="Send stdin to a running async execution",
+        parents=[id_parent],
     )
-    send_stdin_parser.add_argument("--id", required=True, help="Devbox ID")
+    send_stdin_parser.set_defaults(func=devbox.send_stdin)
     send_stdin_parser.add_argument("--execution_id", required=True, help="Execution ID")
     stdin_group = send_stdin_parser.add_mutually_exclusive_group(required=True)
     stdin_group.add_argument("--text", help="Text content to send to stdin")
     stdin_group.add_argument(
-        "--signal", choices=["EOF", "INTERRUPT"], help="Signal to send"
+        "--signal", choices=STDIN_SIGNAL_CHOICES, help="Signal to send"
     )
 
     # Logs
-    logs_parser = subparsers.add_parser("logs", help="View devbox logs")
-    logs_parser.set_defaults(func=lambda args: asyncio.create_task(devbox.logs(args)))
-    logs_parser.add_argument("--id", required=True, help="Devbox ID")
+    logs_parser = subparsers.add_parser(
+        "logs", help="View devbox logs", parents=[id_parent]
+    )
+    logs_parser.set_defaults(func=devbox.logs)
 
     # Suspend / Resume / Shutdown
-    suspend_parser = subparsers.add_parser("suspend", help="Suspend a devbox")
-    suspend_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.suspend(args))
+    suspend_parser = subparsers.add_parser(
+        "suspend", help="Suspend a devbox", parents=[id_parent]
     )
-    suspend_parser.add_argument("--id", required=True, help="Devbox ID")
+    suspend_parser.set_defaults(func=devbox.suspend)
 
-    resume_parser = subparsers.add_parser("resume", help="Resume a devbox")
-    resume_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.resume(args))
+    resume_parser = subparsers.add_parser(
+        "resume", help="Resume a devbox", parents=[id_parent]
     )
-    resume_parser.add_argument("--id", required=True, help="Devbox ID")
+    resume_parser.set_defaults(func=devbox.resume)
 
-    shutdown_parser = subparsers.add_parser("shutdown", help="Shutdown a devbox")
-    shutdown_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.shutdown(args))
+    shutdown_parser = subparsers.add_parser(
+        "shutdown", help="Shutdown a devbox", parents=[id_parent]
     )
-    shutdown_parser.add_argument("--id", required=True, help="Devbox ID")
+    shutdown_parser.set_defaults(func=devbox.shutdown)
 
     # SSH
-    ssh_parser = subparsers.add_parser("ssh", help="SSH into a devbox")
-    ssh_parser.set_defaults(func=lambda args: asyncio.create_task(devbox.ssh(args)))
-    ssh_parser.add_argument("--id", required=True, help="Devbox ID")
+    ssh_parser = subparsers.add_parser(
+        "ssh", help="SSH into a devbox", parents=[id_parent, refresh_key_parent]
+    )
+    ssh_parser.set_defaults(func=devbox.ssh)
     ssh_parser.add_argument(
         "--config-only",
         dest="config_only",
@@ -256,26 +297,28 @@ def setup_devbox_parser(subparsers):
 
     # SCP
     scp_parser = subparsers.add_parser(
-        "scp", help="Copy files to/from a devbox using scp"
+        "scp",
+        help="Copy files to/from a devbox using scp",
+        parents=[id_parent, refresh_key_parent],
     )
-    scp_parser.set_defaults(func=lambda args: asyncio.create_task(devbox.scp(args)))
+    scp_parser.set_defaults(func=devbox.scp)
     scp_parser.add_argument("src", help="Source path. Use :remote_path for remote")
     scp_parser.add_argument("dst", help="Destination path. Use :remote_path for remote")
-    scp_parser.add_argument("--id", required=True, help="Devbox ID")
     scp_parser.add_argument(
         "--scp-options", dest="scp_options", help="Additional scp options (quoted)"
     )
 
     # Rsync
     rsync_parser = subparsers.add_parser(
-        "rsync", help="Sync files to/from a devbox using rsync"
+        "rsync",
+        help="Sync files to/from a devbox using rsync",
+        parents=[id_parent, refresh_key_parent],
     )
-    rsync_parser.set_defaults(func=lambda args: asyncio.create_task(devbox.rsync(args)))
+    rsync_parser.set_defaults(func=devbox.rsync)
     rsync_parser.add_argument("src", help="Source path. Use :remote_path for remote")
     rsync_parser.add_argument(
         "dst", help="Destination path. Use :remote_path for remote"
     )
-    rsync_parser.add_argument("--id", required=True, help="Devbox ID")
     rsync_parser.add_argument(
         "--rsync-options",
         dest="rsync_options",
@@ -284,21 +327,18 @@ def setup_devbox_parser(subparsers):
 
     # Tunnel
     tunnel_parser = subparsers.add_parser(
-        "tunnel", help="Create a port-forwarding tunnel to a devbox"
-    )
-    tunnel_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.tunnel(args))
+        "tunnel",
+        help="Create a port-forwarding tunnel to a devbox",
+        parents=[id_parent, refresh_key_parent],
     )
-    tunnel_parser.add_argument("--id", required=True, help="Devbox ID")
+    tunnel_parser.set_defaults(func=devbox.tunnel)
     tunnel_parser.add_argument("ports", help="Port mapping in the form local:remote")
 
     # File operations via API wrappers
     read_file_parser = subparsers.add_parser(
         "read", help="Read a file from a devbox using the API"
     )
-    read_file_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.devbox_read(args))
-    )
+    read_file_parser.set_defaults(func=devbox.devbox_read)
     read_file_parser.add_argument("--id", required=True, help="ID of the devbox")
     read_file_parser.add_argument(
         "--remote", required=True, help="Remote file path to read from the devbox"
@@ -310,9 +350,7 @@ def setup_devbox_parser(subparsers):
     write_file_parser = subparsers.add_parser(
         "write", help="Write a file to a devbox using the API"
     )
-    write_file_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.devbox_write(args))
-    )
+    write_file_parser.set_defaults(func=devbox.devbox_write)
     write_file_parser.add_argument("--id", required=True, help="ID of the devbox")
     write_file_parser.add_argument(
         "--input", required=True, help="Local file path to read contents from"
@@ -324,9 +362,7 @@ def setup_devbox_parser(subparsers):
     upload_file_parser = subparsers.add_parser(
         "upload_file", help="Upload a file to a devbox"
     )
-    upload_file_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.upload_file(args))
-    )
+    upload_file_parser.set_defaults(func=devbox.upload_file)
     upload_file_parser.add_argument("--id", required=True, help="ID of the devbox")
     upload_file_parser.add_argument(
         "--path", required=True, help="Path where to save the file in the devbox"
@@ -338,9 +374,7 @@ def setup_devbox_parser(subparsers):
     download_file_parser = subparsers.add_parser(
         "download_file", help="Download a file from a devbox"
     )
-    download_file_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.download_file(args))
-    )
+    download_file_parser.set_defaults(func=devbox.download_file)
     download_file_parser.add_argument("--id", required=True, help="ID of the devbox")
     download_file_parser.add_argument(
         "--file_path", required=True, help="Path to the file in the devbox"
@@ -358,44 +392,36 @@ def setup_devbox_parser(subparsers):
     snapshot_create_parser = snapshot_subparsers.add_parser(
         "create", help="Create a snapshot of a devbox"
     )
-    snapshot_create_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.snapshot(args))
-    )
+    snapshot_create_parser.set_defaults(func=devbox.snapshot)
     snapshot_create_parser.add_argument("--devbox_id", required=True, help="Devbox ID")
 
     snapshot_status_parser = snapshot_subparsers.add_parser(
         "status", help="Get snapshot status"
     )
-    snapshot_status_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.get_snapshot_status(args))
-    )
+    snapshot_status_parser.set_defaults(func=devbox.get_snapshot_status)
     snapshot_status_parser.add_argument(
         "--snapshot_id", required=True, help="Snapshot ID"
     )
 
     snapshot_list_parser = snapshot_subparsers.add_parser("list", help="List snapshots")
-    snapshot_list_parser.set_defaults(
-        func=lambda args: asyncio.create_task(devbox.list_snapshots(args))
-    )
+    snapshot_list_parser.set_defaults(func=devbox.list_snapshots)
 
 
 def setup_blueprint_parser(subparsers):
     """Setup the blueprint command parser."""
-    parser = subparsers.add_parser("blueprint", help="Manage blueprints")
+    from .commands import blueprint
+
+    parser = subparsers.add_parser("blueprint", help=COMMAND_HELP["blueprint"])
     subparsers = parser.add_subparsers(dest="subcommand")
 
     # List
     list_parser = subparsers.add_parser("list", help="List blueprints")
     list_parser.add_argument("--name", help="Blueprint name.", type=str, required=False)
-    list_parser.set_defaults(
-        func=lambda args: asyncio.create_task(blueprint.list_blueprints(args))
-    )
+    list_parser.set_defaults(func=blueprint.list_blueprints)
 
     # Create
     create_parser = subparsers.add_parser("create", help="Create blueprint")
-    create_parser.set_defaults(
-        func=lambda args: asyncio.create_task(blueprint.create(args))
-    )
+    create_parser.set_defaults(func=blueprint.create)
     create_parser.add_argument("--name", required=True, help="Blueprint name")
     create_parser.add_argument(
         "--system_setup_commands",
@@ -404,40 +430,19 @@ def setup_blueprint_parser(subparsers):
     )
     create_parser.add_argument("--dockerfile", help="Dockerfile contents")
     create_parser.add_argument("--dockerfile_path", help="Dockerfile path")
-    create_parser.add_argument(
-        "--resources",
-        type=str,
-        help="Resource size",
-        choices=["X_SMALL", "SMALL", "MEDIUM", "LARGE", "X_LARGE", "XX_LARGE"],
-    )
     create_parser.add_argument(
         "--available_ports",
         type=int,
         nargs="+",
         help="Available ports",
     )
-    create_parser.add_argument(
-        "--architecture",
-        type=str,
-        help="Architecture (default: arm64)",
-        choices=["arm64", "x86_64"],
-    )
-    create_parser.add_argument(
-        "--root",
-        action="store_true",
-        help="Run as root",
-    )
-    create_parser.add_argument(
-        "--user", type=_parse_user, metavar="USER:UID", help="Run as this user"
-    )
+    _add_launch_arguments(create_parser)
 
     # Preview
     preview_parser = subparsers.add_parser(
         "preview", help="Preview blueprint before creation"
     )
-    preview_parser.set_defaults(
-        func=lambda args: asyncio.create_task(blueprint.preview(args))
-    )
+    preview_parser.set_defaults(func=blueprint.preview)
     preview_parser.add_argument("--name", required=True, help="Blueprint name")
     preview_parser.add_argument(
         "--system_setup_commands",
@@ -448,27 +453,25 @@ def setup_blueprint_parser(subparsers):
 
     # Get
     get_parser = subparsers.add_parser("get", help="Get blueprint details")
-    get_parser.set_defaults(func=lambda args: asyncio.create_task(blueprint.get(args)))
+    get_parser.set_defaults(func=blueprint.get)
     get_parser.add_argument("--id", required=True, help="Blueprint ID")
 
     # Logs
     logs_parser = subparsers.add_parser("logs", help="Get blueprint build logs")
-    logs_parser.set_defaults(
-        func=lambda args: asyncio.create_task(blueprint.logs(args))
-    )
+    logs_parser.set_defaults(func=blueprint.logs)
     logs_parser.add_argument("--id", required=True, help="Blueprint ID")
 
 
 def setup_object_parser(subparsers):
     """Setup the object command parser."""
-    parser = subparsers.add_parser("object", help="Manage objects")
+    from .commands import object
+
+    parser = subparsers.add_parser("object", help=COMMAND_HELP["object"])
     subparsers = parser.add_subparsers(dest="subcommand")
 
     # List
     list_parser = subparsers.add_parser("list", help="List objects")
-    list_parser.set_defaults(
-        func=lambda args: asyncio.create_task(object.list_objects(args))
-    )
+    list_parser.set_defaults(func=object.list_objects)
     list_parser.add_argument(
         "--limit",
         type=int,
@@ -494,7 +497,7 @@ def setup_object_parser(subparsers):
         "--state",
         type=str,
         help="Filter by state (UPLOADING, READ_ONLY, DELETED)",
-        choices=["UPLOADING", "READ_ONLY", "DELETED"],
+        choices=OBJECT_STATE_CHOICES,
     )
     list_parser.add_argument(
         "--search",
@@ -509,16 +512,14 @@ def setup_object_parser(subparsers):
 
     # Get
     get_parser = subparsers.add_parser("get", help="Get object")
-    get_parser.set_defaults(func=lambda args: asyncio.create_task(object.get(args)))
+    get_parser.set_defaults(func=object.get)
     get_parser.add_argument("--id", required=True, help="Object ID")
 
     # Download
     download_parser = subparsers.add_parser(
         "download", help="Download object to local file"
     )
-    download_parser.set_defaults(
-        func=lambda args: asyncio.create_task(object.download(args))
-    )
+    download_parser.set_defaults(func=object.download)
     download_parser.add_argument("--id", required=True, help="Object ID")
     download_parser.add_argument(
         "--path", required=True, help="Local path to save the file"
@@ -537,9 +538,7 @@ def setup_object_parser(subparsers):
 
     # Upload
     upload_parser = subparsers.add_parser("upload", help="Upload a file as an object")
-    upload_parser.set_defaults(
-        func=lambda args: asyncio.create_task(object.upload(args))
-    )
+    upload_parser.set_defaults(func=object.upload)
     upload_parser.add_argument(
         "--path", required=True, help="Path to the file to upload"
     )
@@ -547,19 +546,34 @@ def setup_object_parser(subparsers):
     upload_parser.add_argument(
         "--content_type",
         help="Content type: unspecified|text|binary|gzip|tar|tgz (auto-detected if omitted)",
-        choices=["unspecified", "text", "binary", "gzip", "tar", "tgz"],
+        choices=CONTENT_TYPE_CHOICES,
     )
 
     # Delete
     delete_parser = subparsers.add_parser(
         "delete", help="Delete an object (irreversible)"
     )
-    delete_parser.set_defaults(
-        func=lambda args: asyncio.create_task(object.delete(args))
-    )
+    delete_parser.set_defaults(func=object.delete)
     delete_parser.add_argument("--id", required=True, help="Object ID to delete")
 
 
+COMMAND_PARSERS = {
+    "devbox": setup_devbox_parser,
+    "blueprint": setup_blueprint_parser,
+    "object": setup_object_parser,
+}
+
+
+def _sniff_command(argv: list[str]) -> str | None:
+    """Return the top-level command named in argv, if any."""
+    # The top-level parser only has flags without values, so the first
+    # positional token is the command
+    for token in argv:
+        if not token.startswith("-"):
+            return token
+    return None
+
+
 async def run():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Perform various devbox operations.")
@@ -567,47 +581,53 @@ async def run():
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    # Setup command parsers
-    setup_devbox_parser(subparsers)
-    setup_blueprint_parser(subparsers)
-    setup_object_parser(subparsers)
+    # Setup command parsers. Only the command being run needs its full
+    # argument tree; the others are registered by name and help so usage,
+    # top-level help and "invalid choice" errors read the same
+    command = _sniff_command(sys.argv[1:])
+    for name, setup_parser in COMMAND_PARSERS.items():
+        if name == command:
+            setup_parser(subparsers)
+        else:
+            subparsers.add_parser(name, help=COMMAND_HELP[name])
 
     args = parser.parse_args()
-    if hasattr(args, "func"):
+    func = getattr(args, "func", None)
+    if func is not None:
         if not os.getenv("RUNLOOP_API_KEY"):
             raise RuntimeError("API key not found, RUNLOOP_API_KEY must be set")
 
-        # Print environment message unless it's SSH config-only
-        should_suppress_env_message = (
-            args.command == "devbox"
-            and hasattr(args, "subcommand")
-            and args.subcommand == "ssh"
-            and hasattr(args, "config_only")
-            and args.config_only
-        )
+        # The environment and update notices are for someone at a terminal;
+        # piped or redirected stderr (scripts, CI) gets neither
+        interactive = sys.stderr.isatty()
 
-        if not should_suppress_env_message:
-            env = os.getenv("RUNLOOP_ENV")
-            if env and env.lower() == "dev":
-                print("Using dev environment", file=sys.stderr)
-            else:
-                print("Using prod environment", file=sys.stderr)
+        # Print environment message unless it's SSH config-only (the only
+        # parser with --config-only)
+        if interactive and not getattr(args, "config_only", False):
+            env = os.getenv("RUNLOOP_ENV", "")
+            env_name = "dev" if env.lower() == "dev" else "prod"
+            print(f"Using {env_name} environment", file=sys.stderr)
 
-        # Check for updates in background
-        try:
-            check_for_updates()
-        except Exception:
-            pass  # Silently ignore update check failures
+        # Check for updates in background; the PyPI request must not delay
+        # the command, and is simply dropped if the command exits first
+        if interactive:
+            threading.Thread(target=_check_for_updates_quietly, daemon=True).start()
 
-        await args.func(args)
+        await func(args)
     else:
         parser.print_help()
 
 
 def main():
     """CLI entry point."""
+    # Answer a bare --version without building parsers or an event loop
+    if sys.argv[1:] == ["--version"]:
+        print(f"rl-cli {__version__}")
+        return
+
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
     try:
-        asyncio.run(run())
+        asyncio.run(run(), loop_factory=loop_factory)
     except Exception as e:
         print(f"error: {e}")
         sys.exit(1)
@@ -1,10 +1,10 @@
 """Utility functions for rl-cli."""
 
 import argparse
-import datetime
 import functools
 import json
 import os
+import time
 import urllib.request
 import urllib.error
 from pathlib import Path
@@ -13,6 +13,9 @@ from runloop_api_client import AsyncRunloop, NOT_GIVEN, NotGiven
 from runloop_api_client.types.shared_params import CodeMountParameters
 from runloop_api_client.types.shared_params.launch_parameters import UserParameters
 
+# Minimum time between checks of PyPI for a newer rl-cli
+UPDATE_CHECK_INTERVAL_SEC = 24 * 60 * 60
+
 
 def base_url() -> str:
     """Get the base URL for the Runloop API."""
@@ -39,12 +42,9 @@ def get_cache_dir() -> Path:
 def should_check_for_updates() -> bool:
     """Check if we should check for updates."""
     cache_file = get_cache_dir() / "last_update_check"
-    if not cache_file.exists():
-        return True
-
+    # A single stat answers both "never checked" and "checked too long ago"
     try:
-        last_check = datetime.datetime.fromtimestamp(cache_file.stat().st_mtime)
-        return (datetime.datetime.now() - last_check).days >= 1
+        return time.time() - cache_file.stat().st_mtime >= UPDATE_CHECK_INTERVAL_SEC
     except OSError:
         return True
 
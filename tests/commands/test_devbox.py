@@ -1,7 +1,9 @@
 """Tests for devbox commands."""
 
+import datetime
 import json
-from unittest.mock import AsyncMock, patch
+import os
+from unittest.mock import AsyncMock, MagicMock, call, patch
 import pytest
 from runloop_api_client import NOT_GIVEN
 
@@ -23,6 +25,13 @@ class MockDevbox:
     def model_dump_json(self, indent=None):
         return json.dumps(self.data, indent=indent)
 
+def mock_subprocess_exec(returncode=0):
+    """Build a stand-in for asyncio.create_subprocess_exec whose process exits with returncode."""
+    proc = MagicMock()
+    proc.returncode = returncode
+    proc.wait = AsyncMock(return_value=returncode)
+    return AsyncMock(return_value=proc)
+
 @pytest.mark.asyncio
 async def test_create_devbox():
     """Test creating a devbox."""
@@ -219,13 +228,15 @@ async def test_logs_printing():
         assert any("-> echo test" in line for line in printed_lines)
         assert any("  hello" in line for line in printed_lines)
         assert any("-> exit_code=0" in line for line in printed_lines)
+        expected_ts = datetime.datetime.fromtimestamp(1710000000.5).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        assert any(f"{expected_ts}  hello" in line for line in printed_lines)
 
 @pytest.mark.asyncio
 async def test_scp_invocation_builds_command():
     """Test scp builds the correct command and executes it."""
     with patch('rl_cli.commands.devbox.get_ssh_key', new=AsyncMock(return_value=("/tmp/key.pem", "key", "host.example", "test-user"))), \
          patch('rl_cli.commands.devbox.ssh_url', return_value="ssh.runloop.ai:443"), \
-         patch('subprocess.run') as mock_run:
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec()) as mock_run:
         args = AsyncMock()
         args.id = "dbx_123"
         args.src = "./local.txt"
@@ -235,17 +246,36 @@ async def test_scp_invocation_builds_command():
         await devbox.scp(args)
 
         mock_run.assert_called_once()
-        cmd = mock_run.call_args.kwargs.get('args') or mock_run.call_args[0][0]
+        cmd = list(mock_run.call_args[0])
         # Ensure scp is invoked and remote path correctly prefixed
         assert cmd[0] == "scp"
         assert f"test-user@host.example:/remote.txt" in cmd
 
+@pytest.mark.asyncio
+async def test_scp_failure_exits_with_returncode():
+    """Test scp exits with the child's return code when it fails."""
+    with patch('rl_cli.commands.devbox.get_ssh_key', new=AsyncMock(return_value=("/tmp/key.pem", "key", "host.example", "test-user"))), \
+         patch('rl_cli.commands.devbox.ssh_url', return_value="ssh.runloop.ai:443"), \
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec(returncode=3)), \
+         patch('rl_cli.commands.devbox.print') as mock_print:
+        args = AsyncMock()
+        args.id = "dbx_123"
+        args.src = "./local.txt"
+        args.dst = ":/remote.txt"
+        args.scp_options = None
+
+        with pytest.raises(SystemExit) as exc_info:
+            await devbox.scp(args)
+
+        assert exc_info.value.code == 3
+        mock_print.assert_called_once_with("SCP command failed with exit code 3")
+
 @pytest.mark.asyncio
 async def test_rsync_invocation_builds_command():
     """Test rsync builds the correct command and executes it."""
     with patch('rl_cli.commands.devbox.get_ssh_key', new=AsyncMock(return_value=("/tmp/key.pem", "key", "host.example", "test-user"))), \
          patch('rl_cli.commands.devbox.ssh_url', return_value="ssh.runloop.ai:443"), \
-         patch('subprocess.run') as mock_run:
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec()) as mock_run:
         args = AsyncMock()
         args.id = "dbx_123"
         args.src = ":/remote_dir"
@@ -255,13 +285,90 @@ async def test_rsync_invocation_builds_command():
         await devbox.rsync(args)
 
         mock_run.assert_called_once()
-        cmd = mock_run.call_args.kwargs.get('args') or mock_run.call_args[0][0]
+        cmd = list(mock_run.call_args[0])
         assert cmd[0] == "rsync"
         # Contains -e with ssh and proxy command
         assert "-e" in cmd
         # Ensure remote arg contains user@host
         assert any(arg.startswith("test-user@host.example:") for arg in cmd)
 
+@pytest.mark.asyncio
+async def test_scp_local_paths_copy_without_ssh(tmp_path):
+    """Test scp between two local paths copies directly without ssh."""
+    src = tmp_path / "a.txt"
+    src.write_text("hello")
+    with patch('rl_cli.commands.devbox.get_ssh_key', new=AsyncMock()) as mock_key, \
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec()) as mock_run:
+        args = AsyncMock()
+        args.id = "dbx_123"
+        args.src = str(src)
+        args.dst = str(tmp_path / "b.txt")
+        args.scp_options = None
+
+        await devbox.scp(args)
+
+        mock_key.assert_not_called()
+        mock_run.assert_not_called()
+        assert (tmp_path / "b.txt").read_text() == "hello"
+
+@pytest.mark.asyncio
+async def test_rsync_local_dir_copy_without_ssh(tmp_path):
+    """Test rsync between two local dirs copies directly without ssh."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "f.txt").write_text("data")
+    dst = tmp_path / "dst"
+    with patch('rl_cli.commands.devbox.get_ssh_key', new=AsyncMock()) as mock_key, \
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec()) as mock_run:
+        args = AsyncMock()
+        args.id = "dbx_123"
+        args.src = str(src)
+        args.dst = str(dst)
+        args.rsync_options = None
+
+        await devbox.rsync(args)
+
+        mock_key.assert_not_called()
+        mock_run.assert_not_called()
+        assert (dst / "src" / "f.txt").read_text() == "data"
+
+@pytest.mark.asyncio
+async def test_rsync_local_lists_files_and_creates_slash_dst(tmp_path, capsys):
+    """Test the local rsync copy lists each file and creates a dst ending in a slash."""
+    src = tmp_path / "a.txt"
+    src.write_text("hello")
+    dst = tmp_path / "new"
+    with patch('rl_cli.commands.devbox.get_ssh_key', new=AsyncMock()) as mock_key:
+        args = AsyncMock()
+        args.id = "dbx_123"
+        args.src = str(src)
+        args.dst = str(dst) + os.sep
+        args.rsync_options = None
+
+        await devbox.rsync(args)
+
+        mock_key.assert_not_called()
+        assert (dst / "a.txt").read_text() == "hello"
+        assert capsys.readouterr().out == "a.txt\n"
+
+@pytest.mark.asyncio
+async def test_scp_local_directory_goes_to_scp(tmp_path):
+    """Test a local directory source is left to scp rather than copied directly."""
+    src = tmp_path / "src"
+    src.mkdir()
+    with patch('rl_cli.commands.devbox.get_ssh_key', new=AsyncMock(return_value=("/tmp/key.pem", "key", "host.example", "test-user"))), \
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec()) as mock_run:
+        args = AsyncMock()
+        args.id = "dbx_123"
+        args.src = str(src)
+        args.dst = str(tmp_path / "dst")
+        args.scp_options = None
+        args.refresh_key = False
+
+        await devbox.scp(args)
+
+        assert mock_run.call_args.args[0] == "scp"
+
 @pytest.mark.asyncio
 async def test_suspend_devbox():
     """Test suspending a devbox."""
@@ -357,9 +464,33 @@ async def test_get_ssh_key():
         
         mock_api_client.devboxes.create_ssh_key.assert_called_once_with("test-devbox-id")
         mock_makedirs.assert_called_once()
-        mock_open.assert_called_once()
+        assert mock_open.call_count == 2  # key file + cached url/user file
         mock_chmod.assert_called_once_with(keyfile_path, 0o600)
 
+@pytest.mark.asyncio
+async def test_get_ssh_key_uses_fresh_cache(tmp_path):
+    """Test a recently written SSH key is reused without calling the API."""
+    mock_ssh_key_result = AsyncMock()
+    mock_ssh_key_result.ssh_private_key = "test-key"
+    mock_ssh_key_result.url = "test-host"
+    mock_ssh_key_result.ssh_user = "test-user"
+
+    mock_api_client = AsyncMock()
+    mock_api_client.devboxes = AsyncMock()
+    mock_api_client.devboxes.create_ssh_key = AsyncMock(return_value=mock_ssh_key_result)
+
+    runloop_api_client.cache_clear()
+
+    with patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('os.path.expanduser', side_effect=lambda p: p.replace("~", str(tmp_path))):
+        first = await devbox.get_ssh_key("test-devbox-id")
+        second = await devbox.get_ssh_key("test-devbox-id")
+        assert first == second
+        mock_api_client.devboxes.create_ssh_key.assert_called_once_with("test-devbox-id")
+
+        await devbox.get_ssh_key("test-devbox-id", refresh=True)
+        assert mock_api_client.devboxes.create_ssh_key.call_count == 2
+
 @pytest.mark.asyncio
 async def test_get_ssh_key_failure():
     """Test SSH key creation failure."""
@@ -396,7 +527,7 @@ async def test_ssh_command():
          patch('builtins.open', create=True), \
          patch('os.chmod'), \
          patch('os.fsync'), \
-         patch('subprocess.run') as mock_run, \
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec()) as mock_run, \
          patch('rl_cli.commands.devbox.ssh_url', return_value="ssh.runloop.ai:443"), \
          patch('rl_cli.commands.devbox.wait_for_ready', new=AsyncMock(return_value=True)):
         
@@ -410,7 +541,7 @@ async def test_ssh_command():
         await devbox.ssh(args)
         
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        call_args = list(mock_run.call_args[0])
         assert "/usr/bin/ssh" in call_args
         assert "test-user@test-host" in " ".join(call_args)
 
@@ -433,8 +564,7 @@ async def test_tunnel_command():
          patch('builtins.open', create=True), \
          patch('os.chmod'), \
          patch('os.fsync'), \
-         patch('subprocess.run') as mock_run, \
-         patch('signal.signal'), \
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec()) as mock_run, \
          patch('rl_cli.commands.devbox.print') as mock_print, \
          patch('rl_cli.commands.devbox.ssh_url', return_value="ssh.runloop.ai:443"):
         
@@ -445,7 +575,7 @@ async def test_tunnel_command():
         await devbox.tunnel(args)
         
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        call_args = list(mock_run.call_args[0])
         assert "/usr/bin/ssh" in call_args
         assert "-L" in call_args
         assert "8080:localhost:3000" in call_args
@@ -454,9 +584,18 @@ async def test_tunnel_command():
 @pytest.mark.asyncio
 async def test_read_file():
     """Test reading a file from a devbox."""
+    async def mock_iter_bytes(chunk_size):
+        yield b"file "
+        yield b"content"
+
+    mock_response = MagicMock()
+    mock_response.iter_bytes = mock_iter_bytes
+
     mock_api_client = AsyncMock()
     mock_api_client.devboxes = AsyncMock()
-    mock_api_client.devboxes.read_file_contents = AsyncMock(return_value="file content")
+    mock_streaming = MagicMock()
+    mock_streaming.read_file_contents.return_value.__aenter__.return_value = mock_response
+    mock_api_client.devboxes.with_streaming_response = mock_streaming
 
     runloop_api_client.cache_clear()
 
@@ -471,11 +610,13 @@ async def test_read_file():
         
         await devbox.read_file(args)
         
-        mock_api_client.devboxes.read_file_contents.assert_called_once_with(
+        mock_streaming.read_file_contents.assert_called_once_with(
             id="test-devbox-id", 
             file_path="/path/to/remote/file.txt"
         )
-        mock_open.assert_called_once_with("/path/to/local/file.txt", "w", encoding="utf-8")
+        mock_open.assert_called_once_with("/path/to/local/file.txt", "wb")
+        mock_file = mock_open.return_value.__enter__.return_value
+        assert mock_file.write.call_args_list == [call(b"file "), call(b"content")]
         mock_print.assert_called_once_with(
             "Wrote remote file /path/to/remote/file.txt from devbox test-devbox-id to local file /path/to/local/file.txt"
         )
@@ -491,6 +632,7 @@ async def test_write_file():
 
     with patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
          patch('os.path.exists', return_value=True), \
+         patch('os.path.getsize', return_value=18), \
          patch('builtins.open', create=True) as mock_open, \
          patch('rl_cli.commands.devbox.print') as mock_print:
         
@@ -512,6 +654,32 @@ async def test_write_file():
             "Wrote local file /path/to/local/file.txt to remote file /path/to/remote/file.txt on devbox test-devbox-id"
         )
 
+@pytest.mark.asyncio
+async def test_write_file_large_uses_upload(tmp_path):
+    """Test writing a file above the size threshold streams it via upload_file."""
+    mock_api_client = AsyncMock()
+    mock_api_client.devboxes = AsyncMock()
+    mock_api_client.devboxes.write_file_contents = AsyncMock()
+    mock_api_client.devboxes.upload_file = AsyncMock()
+
+    runloop_api_client.cache_clear()
+
+    local = tmp_path / "big.bin"
+    local.write_bytes(b"x" * (devbox.WRITE_FILE_MAX_BYTES + 1))
+
+    with patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.devbox.print'):
+        args = AsyncMock()
+        args.id = "test-devbox-id"
+        args.input = str(local)
+        args.remote = "/remote/big.bin"
+
+        await devbox.write_file(args)
+
+        mock_api_client.devboxes.write_file_contents.assert_not_called()
+        mock_api_client.devboxes.upload_file.assert_called_once()
+        assert mock_api_client.devboxes.upload_file.call_args.kwargs["path"] == "/remote/big.bin"
+
 @pytest.mark.asyncio
 async def test_devbox_read_wrapper_calls_read_file():
     """devbox_read should delegate to read_file."""
@@ -661,6 +829,63 @@ async def test_wait_for_ready_timeout():
         assert any("Timeout waiting for devbox" in str(call) for call in mock_print.call_args_list)
 
 
+@pytest.mark.asyncio
+async def test_wait_for_ready_backoff():
+    """Test wait_for_ready backs off between polls and reports each status once."""
+    mock_api_client = AsyncMock()
+    mock_api_client.devboxes = AsyncMock()
+    statuses = ["provisioning", "provisioning", "initializing", "running"]
+    mock_devboxes = []
+    for status in statuses:
+        mock_devbox = AsyncMock()
+        mock_devbox.status = status
+        mock_devboxes.append(mock_devbox)
+    mock_api_client.devboxes.retrieve = AsyncMock(side_effect=mock_devboxes)
+
+    runloop_api_client.cache_clear()
+
+    with patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.devbox.print') as mock_print, \
+         patch('rl_cli.commands.devbox.random.uniform', return_value=1.0), \
+         patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+
+        result = await devbox.wait_for_ready("test-devbox-id", timeout_seconds=60, poll_interval_seconds=1)
+
+        assert result is True
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 4.0]
+        still_lines = [c for c in mock_print.call_args_list if "is still" in str(c)]
+        assert len(still_lines) == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_ready_clamps_sleep_to_deadline():
+    """Test the backoff never sleeps past the timeout and reports the real pause."""
+    mock_api_client = AsyncMock()
+    mock_api_client.devboxes = AsyncMock()
+    mock_api_client.devboxes.retrieve = AsyncMock(side_effect=RuntimeError("unavailable"))
+
+    clock = [0.0]
+
+    async def fake_sleep(seconds):
+        clock[0] += seconds
+
+    runloop_api_client.cache_clear()
+
+    with patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.devbox.print') as mock_print, \
+         patch('rl_cli.commands.devbox.time.monotonic', side_effect=lambda: clock[0]), \
+         patch('rl_cli.commands.devbox.random.uniform', return_value=1.2), \
+         patch('asyncio.sleep', side_effect=fake_sleep) as mock_sleep:
+
+        result = await devbox.wait_for_ready("test-devbox-id", timeout_seconds=10, poll_interval_seconds=5)
+
+        assert result is False
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [6.0, 4.0]
+        retry_lines = [str(c) for c in mock_print.call_args_list if "retrying in" in str(c)]
+        assert "retrying in 6 seconds" in retry_lines[0]
+        assert "retrying in 4 seconds" in retry_lines[1]
+
+
 @pytest.mark.asyncio
 async def test_snapshot():
     """Test creating a devbox snapshot."""
@@ -769,7 +994,7 @@ async def test_ssh_with_no_wait():
          patch('builtins.open', create=True), \
          patch('os.chmod'), \
          patch('os.fsync'), \
-         patch('subprocess.run') as mock_run, \
+         patch('asyncio.create_subprocess_exec', new=mock_subprocess_exec()) as mock_run, \
          patch('rl_cli.commands.devbox.ssh_url', return_value="ssh.runloop.ai:443"):
         
         args = AsyncMock()
@@ -6,6 +6,7 @@ import tempfile
 import zipfile
 import tarfile
 import zstandard
+import aiohttp
 from unittest.mock import AsyncMock, patch, mock_open
 import pytest
 from rl_cli.main import run
@@ -467,6 +468,193 @@ async def test_object_download_extract_unsupported(tmp_path, capsys):
     # Verify error raised for unsupported extraction
     assert "not a supported archive type" in str(excinfo.value)
 
+class RangeResponse:
+    """Minimal aiohttp-like response serving a byte range of a payload."""
+
+    def __init__(self, payload, range_header=None):
+        if range_header is None:
+            self.status = 200
+            self.body = payload
+            self.headers = {'content-length': str(len(payload))}
+        else:
+            start, end = (int(x) for x in range_header[len("bytes="):].split("-"))
+            end = min(end, len(payload) - 1)
+            if start >= len(payload):
+                self.status = 416
+                self.body = b""
+                self.headers = {'content-range': f"bytes */{len(payload)}"}
+            else:
+                self.status = 206
+                self.body = payload[start:end + 1]
+                self.headers = {'content-range': f"bytes {start}-{end}/{len(payload)}"}
+        self.content = self
+
+    async def text(self):
+        return ""
+
+    async def iter_chunked(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+    def release(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+@pytest.mark.asyncio
+async def test_object_download_parallel_ranges(tmp_path, capsys):
+    """Test a range-capable download is reassembled from concurrent parts."""
+    payload = bytes(range(256)) * 5  # 1280 bytes -> several 100-byte parts
+
+    mock_api_client = AsyncMock()
+    mock_objects = AsyncMock()
+    mock_objects.download = AsyncMock(
+        return_value=AsyncMock(download_url="https://example.com/download")
+    )
+    mock_objects.retrieve = AsyncMock(return_value=MockObject(name="data.bin"))
+    mock_api_client.objects = mock_objects
+
+    requested_ranges = []
+
+    async def fake_get(url, headers=None):
+        range_header = (headers or {}).get("Range")
+        requested_ranges.append(range_header)
+        return RangeResponse(payload, range_header)
+
+    target_path = tmp_path / "data.bin"
+    runloop_api_client.cache_clear()
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.object.DOWNLOAD_PART_SIZE', 100), \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id', '--path', str(target_path)]), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}):
+        session_instance = AsyncMock()
+        session_instance.get = fake_get
+        mock_session.return_value.__aenter__.return_value = session_instance
+        await run()
+
+    assert target_path.read_bytes() == payload
+    assert len(requested_ranges) == 13
+    assert requested_ranges[0] == "bytes=0-99"
+
+def _wrong_slice(payload, range_header):
+    """Serve the first part instead of the range asked for."""
+    return RangeResponse(payload, "bytes=0-99")
+
+def _short_body(payload, range_header):
+    """Serve the right Content-Range with a truncated body."""
+    response = RangeResponse(payload, range_header)
+    response.body = response.body[:-1]
+    return response
+
+@pytest.mark.parametrize('bad_response,message', [
+    (_wrong_slice, "Content-Range 'bytes 0-99/1280'"),
+    (_short_body, "received 99 bytes"),
+])
+@pytest.mark.asyncio
+async def test_object_download_rejects_mismatched_range(tmp_path, bad_response, message):
+    """Test a part that does not match the requested slice fails the download."""
+    payload = bytes(range(256)) * 5
+
+    mock_api_client = AsyncMock()
+    mock_objects = AsyncMock()
+    mock_objects.download = AsyncMock(
+        return_value=AsyncMock(download_url="https://example.com/download")
+    )
+    mock_objects.retrieve = AsyncMock(return_value=MockObject(name="data.bin"))
+    mock_api_client.objects = mock_objects
+
+    async def fake_get(url, headers=None):
+        range_header = (headers or {}).get("Range")
+        if range_header == "bytes=300-399":
+            return bad_response(payload, range_header)
+        return RangeResponse(payload, range_header)
+
+    target_path = tmp_path / "data.bin"
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.object.DOWNLOAD_PART_SIZE', 100), \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id', '--path', str(target_path)]), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}), \
+         pytest.raises(RuntimeError, match="bytes 300-399") as exc_info:
+        session_instance = AsyncMock()
+        session_instance.get = fake_get
+        mock_session.return_value.__aenter__.return_value = session_instance
+        await run()
+
+    assert message in str(exc_info.value)
+
+@pytest.mark.asyncio
+async def test_object_download_short_first_part_fails(tmp_path):
+    """Test a ranged download missing bytes fails instead of truncating the file."""
+    payload = bytes(range(256)) * 5
+
+    mock_api_client = AsyncMock()
+    mock_objects = AsyncMock()
+    mock_objects.download = AsyncMock(
+        return_value=AsyncMock(download_url="https://example.com/download")
+    )
+    mock_objects.retrieve = AsyncMock(return_value=MockObject(name="data.bin"))
+    mock_api_client.objects = mock_objects
+
+    async def fake_get(url, headers=None):
+        range_header = (headers or {}).get("Range")
+        if range_header == "bytes=0-99":
+            return _short_body(payload, range_header)
+        return RangeResponse(payload, range_header)
+
+    target_path = tmp_path / "data.bin"
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.object.DOWNLOAD_PART_SIZE', 100), \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id', '--path', str(target_path)]), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}), \
+         pytest.raises(RuntimeError, match="received 1279 of 1280 bytes"):
+        session_instance = AsyncMock()
+        session_instance.get = fake_get
+        mock_session.return_value.__aenter__.return_value = session_instance
+        await run()
+
+@pytest.mark.asyncio
+async def test_object_download_empty_object(tmp_path, capsys):
+    """Test an empty object, whose first range is unsatisfiable, downloads as an empty file."""
+    mock_api_client = AsyncMock()
+    mock_objects = AsyncMock()
+    mock_objects.download = AsyncMock(
+        return_value=AsyncMock(download_url="https://example.com/download")
+    )
+    mock_objects.retrieve = AsyncMock(return_value=MockObject(name="empty.bin", size_bytes=0))
+    mock_api_client.objects = mock_objects
+
+    requested_ranges = []
+
+    async def fake_get(url, headers=None):
+        range_header = (headers or {}).get("Range")
+        requested_ranges.append(range_header)
+        return RangeResponse(b"", range_header)
+
+    target_path = tmp_path / "empty.bin"
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.object.DOWNLOAD_PART_SIZE', 100), \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id', '--path', str(target_path)]), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}):
+        session_instance = AsyncMock()
+        session_instance.get = fake_get
+        mock_session.return_value.__aenter__.return_value = session_instance
+        await run()
+
+    assert target_path.read_bytes() == b""
+    assert requested_ranges == ["bytes=0-99", None]
+
 @pytest.mark.asyncio
 async def test_object_upload_file_not_found(capsys):
     """Test object upload with non-existent file."""
@@ -616,4 +804,536 @@ async def test_object_delete_not_found(capsys):
         await run()
 
     assert "Failed to delete object" in str(exc_info.value)
-    assert "Object not found" in str(exc_info.value)
\ No newline at end of file
+    assert "Object not found" in str(exc_info.value)
+
+
+def test_progress_line_throttles_updates(capsys):
+    """Test progress output is rate limited but always reaches 100%."""
+    from rl_cli.commands.object import _ProgressLine
+
+    with patch('rl_cli.commands.object.time.monotonic', return_value=100.0):
+        progress = _ProgressLine(1000, "Progress")
+        for _ in range(10):
+            progress.advance(100)
+
+    err = capsys.readouterr().err
+    assert err.count("\r") == 1
+    assert "Progress: 100.0%" in err
+
+@pytest.mark.asyncio
+async def test_file_chunks_streams_whole_file(tmp_path):
+    """Test the upload body generator yields the file in order and tracks progress."""
+    from rl_cli.commands.object import _file_chunks, _ProgressLine
+
+    payload = os.urandom(2500)
+    path = tmp_path / "payload.bin"
+    path.write_bytes(payload)
+    progress = _ProgressLine(len(payload), "Progress")
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with patch('rl_cli.commands.object.IO_CHUNK_SIZE', 1000):
+            chunks = [chunk async for chunk in _file_chunks(fd, progress)]
+            # A retried upload streams the file again from the start
+            retried = [chunk async for chunk in _file_chunks(fd, _ProgressLine(2500))]
+    finally:
+        os.close(fd)
+
+    assert [len(c) for c in chunks] == [1000, 1000, 500]
+    assert b"".join(chunks) == payload
+    assert b"".join(retried) == payload
+    assert progress.bytes_done == len(payload)
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="requires posix_fadvise")
+@pytest.mark.asyncio
+async def test_file_chunks_drops_sent_pages(tmp_path):
+    """Test the upload body generator releases already-sent pages from the cache."""
+    from rl_cli.commands.object import _file_chunks, _ProgressLine
+
+    path = tmp_path / "payload.bin"
+    path.write_bytes(os.urandom(2500))
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with patch('rl_cli.commands.object.IO_CHUNK_SIZE', 1000), \
+             patch('rl_cli.commands.object.PAGE_CACHE_DROP_INTERVAL', 2000), \
+             patch('os.posix_fadvise') as mock_fadvise:
+            async for _ in _file_chunks(fd, _ProgressLine(2500, "Progress")):
+                pass
+    finally:
+        os.close(fd)
+
+    dropped = [c.args[1:] for c in mock_fadvise.call_args_list if c.args[3] == os.POSIX_FADV_DONTNEED]
+    assert dropped == [(0, 2000, os.POSIX_FADV_DONTNEED)]
+
+def test_extract_tar_zst_rejects_path_traversal(tmp_path):
+    """Test streamed .tar.zst extraction refuses members escaping the target dir."""
+    from rl_cli.commands.object import extract_archive
+
+    tar_path = tmp_path / "evil.tar"
+    with tarfile.open(tar_path, "w") as tar:
+        data = tmp_path / "payload.txt"
+        data.write_text("oops")
+        tar.add(data, arcname="../escaped.txt")
+    archive = tmp_path / "evil.tar.zst"
+    archive.write_bytes(zstandard.ZstdCompressor().compress(tar_path.read_bytes()))
+
+    extract_dir = tmp_path / "out"
+    extract_dir.mkdir()
+    with pytest.raises(RuntimeError, match="path traversal"):
+        extract_archive(str(archive), str(extract_dir))
+    assert not (tmp_path / "escaped.txt").exists()
+
+def test_extract_zip_parallel(tmp_path):
+    """Test zip members spread over worker threads all land in place."""
+    from rl_cli.commands.object import extract_zip
+
+    archive = tmp_path / "many.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i in range(40):
+            zf.writestr(f"dir{i % 4}/nested/file{i}.txt", f"content {i}" * 100)
+
+    extract_dir = tmp_path / "out"
+    with patch('rl_cli.commands.object.os.cpu_count', return_value=4):
+        extract_zip(str(archive), str(extract_dir))
+
+    for i in range(40):
+        assert (extract_dir / f"dir{i % 4}" / "nested" / f"file{i}.txt").read_text() == f"content {i}" * 100
+
+def test_extract_zst_long_window(tmp_path):
+    """Test .zst files compressed with a window above zstd's default limit extract."""
+    from rl_cli.commands.object import extract_archive
+
+    payload = os.urandom(1 << 16) * 4
+    params = zstandard.ZstdCompressionParameters.from_level(3, window_log=28, enable_ldm=True)
+    archive = tmp_path / "big.bin.zst"
+    # Streamed frames carry no content size, so the decoder needs the full window
+    with open(archive, "wb") as f, \
+         zstandard.ZstdCompressor(compression_params=params).stream_writer(f) as writer:
+        writer.write(payload)
+
+    extract_dir = tmp_path / "out"
+    extract_archive(str(archive), str(extract_dir))
+    assert (extract_dir / "big.bin").read_bytes() == payload
+
+@pytest.mark.parametrize('path,expected', [
+    ('notes.txt', 'text'),
+    ('/data/REPORT.JSON', 'text'),
+    ('bundle.tar.gz', 'tgz'),
+    ('dir.v2/bundle.TGZ', 'tgz'),
+    ('backup.tar', 'tar'),
+    ('log.gz', 'gzip'),
+    ('archive.tar.zst', 'unspecified'),
+    ('release.v1.txt', 'text'),
+    ('Makefile', 'unspecified'),
+    ('.bashrc', 'unspecified'),
+])
+def test_detect_content_type(path, expected):
+    """Test content type detection from file extensions."""
+    from rl_cli.commands.object import detect_content_type
+
+    assert detect_content_type(path) == expected
+
+@pytest.mark.asyncio
+async def test_object_list_forwards_only_set_filters(capsys):
+    """Test object list passes only the filters that were given."""
+    mock_api_client = AsyncMock()
+    mock_objects = AsyncMock()
+    mock_objects.list = AsyncMock(return_value=AsyncMock(objects=[MockObject()]))
+    mock_api_client.objects = mock_objects
+
+    runloop_api_client.cache_clear()
+    with patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('sys.argv', ['rl', 'object', 'list', '--name', 'test', '--state', 'READ_ONLY']), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}):
+        await run()
+
+    mock_objects.list.assert_called_once_with(limit=20, name='test', state='READ_ONLY')
+    mock_objects.list_public.assert_not_called()
+    assert "test-obj-id" in capsys.readouterr().out
+
+@pytest.mark.parametrize('size,expected', [
+    (None, 'N/A'),
+    (0, '0 B'),
+    (1023, '1023 B'),
+    (1024, '1.0 KB'),
+    (1536, '1.5 KB'),
+    (5 * 1024 * 1024, '5.0 MB'),
+    (3 * 1024 ** 3, '3.0 GB'),
+    (2048 * 1024 ** 3, '2048.0 GB'),
+])
+def test_format_size(size, expected):
+    """Test human-readable object sizes."""
+    from rl_cli.commands.object import _format_size
+
+    assert _format_size(size) == expected
+
+def test_sniff_archive_detects_formats_by_content(tmp_path):
+    """Test archives are recognised from their leading bytes, not their names."""
+    from rl_cli.commands.object import _sniff_archive, is_extractable
+
+    payload = tmp_path / "payload.txt"
+    payload.write_text("data")
+
+    zip_path = tmp_path / "zip.bin"
+    with zipfile.ZipFile(zip_path, 'w') as zf:
+        zf.write(payload, "payload.txt")
+    tar_path = tmp_path / "tar.bin"
+    with tarfile.open(tar_path, "w") as tar:
+        tar.add(payload, arcname="payload.txt")
+    tgz_path = tmp_path / "tgz.bin"
+    with tarfile.open(tgz_path, "w:gz") as tar:
+        tar.add(payload, arcname="payload.txt")
+    zst_path = tmp_path / "zst.bin"
+    zst_path.write_bytes(zstandard.ZstdCompressor().compress(b"data"))
+
+    assert _sniff_archive(str(zip_path)) == "zip"
+    assert _sniff_archive(str(tar_path)) == "tar"
+    assert _sniff_archive(str(tgz_path)) == "tar"
+    assert _sniff_archive(str(zst_path)) == "zst"
+    assert _sniff_archive(str(payload)) is None
+    assert not is_extractable(str(tmp_path / "missing.zip"))
+
+@pytest.mark.asyncio
+async def test_object_download_extract_failure_keeps_existing_dir(tmp_path):
+    """Test a failed extraction leaves the previous extraction directory intact."""
+    test_zip = tmp_path / "test.zip"
+    with zipfile.ZipFile(test_zip, 'w') as zf:
+        zf.writestr('new.txt', 'new')
+
+    mock_api_client = AsyncMock()
+    mock_objects = AsyncMock()
+    mock_objects.download = AsyncMock(
+        return_value=AsyncMock(download_url="https://example.com/download")
+    )
+    mock_objects.retrieve = AsyncMock(return_value=MockObject(name="test.zip"))
+    mock_api_client.objects = mock_objects
+
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.headers = {'content-length': str(os.path.getsize(test_zip))}
+
+    async def mock_iter_chunked(chunk_size):
+        yield test_zip.read_bytes()
+
+    mock_response.content.iter_chunked = mock_iter_chunked
+
+    extract_path = tmp_path / "extract_here"
+    extract_path.mkdir()
+    (extract_path / 'old.txt').write_text('old')
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.object.extract_archive', side_effect=RuntimeError("corrupt")), \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id',
+                            '--path', str(extract_path), '--extract']), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}):
+        session_instance = AsyncMock()
+        session_instance.get.return_value = mock_response
+        mock_session.return_value.__aenter__.return_value = session_instance
+        with pytest.raises(RuntimeError, match="corrupt"):
+            await run()
+
+    assert (extract_path / 'old.txt').read_text() == 'old'
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['extract_here', 'test.zip']
+
+@pytest.mark.asyncio
+async def test_retry_async_jitters_backoff_and_checks_status():
+    """Test retries back off with jitter and only repeat on server-side errors."""
+    from rl_cli.commands.object import _retry_async
+
+    class StatusError(Exception):
+        def __init__(self, status_code):
+            super().__init__("request failed")
+            self.status_code = status_code
+
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise StatusError(503)
+        return "ok"
+
+    with patch('rl_cli.commands.object.random.uniform', return_value=1.5), \
+         patch('rl_cli.commands.object.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+        assert await _retry_async(flaky, attempts=3, base_delay_sec=1.0) == "ok"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.5, 3.0]
+
+        async def not_found():
+            raise StatusError(404)
+
+        with pytest.raises(StatusError):
+            await _retry_async(not_found, attempts=3, base_delay_sec=1.0)
+        assert mock_sleep.call_count == 2
+
+@pytest.mark.asyncio
+async def test_write_body_batches_small_chunks(tmp_path):
+    """Test response chunks are gathered into large positional writes."""
+    from rl_cli.commands.object import _write_body, _ProgressLine
+
+    payload = os.urandom(10_000)
+    response = AsyncMock()
+
+    async def mock_iter_chunked(chunk_size):
+        for start in range(0, len(payload), 100):
+            yield payload[start:start + 100]
+
+    response.content.iter_chunked = mock_iter_chunked
+    progress = _ProgressLine(len(payload) + 5)
+    path = tmp_path / "out.bin"
+
+    with open(path, "wb") as f:
+        f.write(b"head-")
+        with patch('rl_cli.commands.object.WRITE_BATCH_SIZE', 4000), \
+             patch('rl_cli.commands.object.os.pwrite', wraps=os.pwrite) as mock_pwrite:
+            await _write_body(response, f.fileno(), 5, progress)
+
+    assert mock_pwrite.call_count == 3
+    assert path.read_bytes() == b"head-" + payload
+    assert progress.bytes_done == len(payload)
+
+def _streaming_download_mocks(payload, name, fail_after=None):
+    """Build API and response mocks serving payload in small chunks."""
+    mock_api_client = AsyncMock()
+    mock_objects = AsyncMock()
+    mock_objects.download = AsyncMock(
+        return_value=AsyncMock(download_url="https://example.com/download")
+    )
+    mock_objects.retrieve = AsyncMock(return_value=MockObject(name=name))
+    mock_api_client.objects = mock_objects
+
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.headers = {'content-length': str(len(payload))}
+
+    async def mock_iter_chunked(chunk_size):
+        for start in range(0, len(payload), 4096):
+            if fail_after is not None and start >= fail_after:
+                raise aiohttp.ClientPayloadError("connection reset")
+            yield payload[start:start + 4096]
+
+    mock_response.content.iter_chunked = mock_iter_chunked
+    return mock_api_client, mock_response
+
+@pytest.mark.asyncio
+async def test_object_download_mislabelled_archive_falls_back_to_file(tmp_path):
+    """Test a zip named .zst is fetched to disk and extracted by content, not streamed."""
+    archive = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("a.txt", "hello")
+    payload = archive.read_bytes()
+
+    mock_api_client = AsyncMock()
+    mock_objects = AsyncMock()
+    mock_objects.download = AsyncMock(
+        return_value=AsyncMock(download_url="https://example.com/download")
+    )
+    mock_objects.retrieve = AsyncMock(return_value=MockObject(name="bundle.zst"))
+    mock_api_client.objects = mock_objects
+
+    async def fake_get(url, headers=None):
+        return RangeResponse(payload, (headers or {}).get("Range"))
+
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    extract_path = tmp_path / "out"
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.object.tempfile.gettempdir', return_value=str(temp_dir)), \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id',
+                            '--path', str(extract_path), '--extract']), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}):
+        session_instance = AsyncMock()
+        session_instance.get = fake_get
+        mock_session.return_value.__aenter__.return_value = session_instance
+        await run()
+
+    assert (extract_path / "a.txt").read_text() == "hello"
+    assert list(temp_dir.iterdir()) == []
+
+@pytest.mark.parametrize('tar_mode', ['w:gz', 'w', 'w:bz2'])
+@pytest.mark.asyncio
+async def test_object_download_streams_tar_gz_into_extractor(tmp_path, tar_mode):
+    """Test tar.gz downloads are extracted as they arrive, without a temp archive.
+
+    The compression is detected from the data, so a .tar.gz holding a plain
+    or bzip2 tar extracts too.
+    """
+    source = tmp_path / "source"
+    source.mkdir()
+    for i in range(20):
+        (source / f"file{i}.bin").write_bytes(os.urandom(8192))
+    archive = tmp_path / "bundle.tar.gz"
+    with tarfile.open(archive, tar_mode) as tar:
+        tar.add(source, arcname=".")
+    mock_api_client, mock_response = _streaming_download_mocks(archive.read_bytes(), "bundle.tar.gz")
+
+    temp_dir = tmp_path / "tmp"
+    temp_dir.mkdir()
+    extract_path = tmp_path / "out"
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.object.tempfile.gettempdir', return_value=str(temp_dir)), \
+         patch('rl_cli.commands.object._open_download') as mock_open_download, \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id',
+                            '--path', str(extract_path), '--extract']), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}):
+        session_instance = AsyncMock()
+        session_instance.get.return_value = mock_response
+        mock_session.return_value.__aenter__.return_value = session_instance
+        await run()
+
+    mock_open_download.assert_not_called()
+    assert list(temp_dir.iterdir()) == []
+    for i in range(20):
+        assert (extract_path / f"file{i}.bin").read_bytes() == (source / f"file{i}.bin").read_bytes()
+
+@pytest.mark.asyncio
+async def test_object_download_stream_failure_keeps_existing_dir(tmp_path):
+    """Test a download cut off mid-stream does not replace the extraction dir."""
+    payload = zstandard.ZstdCompressor().compress(os.urandom(64 * 1024))
+    mock_api_client, mock_response = _streaming_download_mocks(payload, "data.bin.zst", fail_after=4096)
+
+    extract_path = tmp_path / "out"
+    extract_path.mkdir()
+    (extract_path / 'old.txt').write_text('old')
+
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id',
+                            '--path', str(extract_path), '--extract']), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}):
+        session_instance = AsyncMock()
+        session_instance.get.return_value = mock_response
+        mock_session.return_value.__aenter__.return_value = session_instance
+        with pytest.raises(aiohttp.ClientPayloadError):
+            await run()
+
+    assert [p.name for p in extract_path.iterdir()] == ['old.txt']
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['out']
+
+def test_extract_tar_zst_multiple_frames(tmp_path):
+    """Test .tar.zst archives written as several zstd frames extract completely."""
+    from rl_cli.commands.object import extract_archive
+
+    tar_path = tmp_path / "multi.tar"
+    with tarfile.open(tar_path, "w") as tar:
+        for i in range(4):
+            member = tmp_path / f"part{i}.bin"
+            member.write_bytes(os.urandom(50_000))
+            tar.add(member, arcname=member.name)
+    raw = tar_path.read_bytes()
+
+    # Compress each slice as its own frame, as parallel compressors do
+    cctx = zstandard.ZstdCompressor()
+    archive = tmp_path / "multi.tar.zst"
+    archive.write_bytes(b"".join(
+        cctx.compress(raw[start:start + 30_000]) for start in range(0, len(raw), 30_000)
+    ))
+
+    extract_dir = tmp_path / "out"
+    extract_archive(str(archive), str(extract_dir))
+
+    for i in range(4):
+        assert (extract_dir / f"part{i}.bin").read_bytes() == (tmp_path / f"part{i}.bin").read_bytes()
+
+@pytest.mark.asyncio
+async def test_extract_into_restores_old_dir_when_swap_fails(tmp_path):
+    """Test the previous extraction dir is moved back if the final rename fails."""
+    from rl_cli.commands.object import _extract_into
+
+    extract_dir = tmp_path / "out"
+    extract_dir.mkdir()
+    (extract_dir / 'old.txt').write_text('old')
+
+    async def extract(staging_dir):
+        with open(os.path.join(staging_dir, 'new.txt'), 'w') as f:
+            f.write('new')
+
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if dst == str(extract_dir) and os.path.basename(src) == 'new':
+            raise PermissionError("busy")
+        return real_replace(src, dst)
+
+    with patch('rl_cli.commands.object.os.replace', side_effect=failing_replace), \
+         pytest.raises(PermissionError):
+        await _extract_into(str(extract_dir), extract)
+
+    assert [p.name for p in extract_dir.iterdir()] == ['old.txt']
+    assert [p.name for p in tmp_path.iterdir()] == ['out']
+
+@pytest.mark.asyncio
+async def test_extract_into_ignores_leftover_staging_dirs(tmp_path):
+    """Test leftovers from a killed run with the same PID do not block extraction."""
+    from rl_cli.commands.object import _extract_into
+
+    extract_dir = tmp_path / "out"
+    (tmp_path / f"out.tmp.{os.getpid()}").mkdir()
+    (tmp_path / f"out.old.{os.getpid()}").mkdir()
+
+    async def extract(staging_dir):
+        with open(os.path.join(staging_dir, 'new.txt'), 'w') as f:
+            f.write('new')
+
+    await _extract_into(str(extract_dir), extract)
+
+    assert (extract_dir / 'new.txt').read_text() == 'new'
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'out', f'out.old.{os.getpid()}', f'out.tmp.{os.getpid()}'
+    ]
+
+def test_safe_extract_tar_rejects_sibling_prefix(tmp_path):
+    """Test a member escaping into a sibling dir sharing the target's prefix is refused."""
+    from rl_cli.commands.object import safe_extract_tar
+
+    data = tmp_path / "payload.txt"
+    data.write_text("oops")
+    tar_path = tmp_path / "evil.tar"
+    with tarfile.open(tar_path, "w") as tar:
+        tar.add(data, arcname="../out2/escaped.txt")
+
+    with tarfile.open(tar_path) as tar, pytest.raises(RuntimeError, match="path traversal"):
+        safe_extract_tar(tar, str(tmp_path / "out"))
+    assert not (tmp_path / "out2").exists()
+
+def test_extract_zst_multiple_frames(tmp_path):
+    """Test single-file .zst archives made of several frames decompress completely."""
+    from rl_cli.commands.object import extract_archive
+
+    payload = os.urandom(100_000)
+    cctx = zstandard.ZstdCompressor()
+    archive = tmp_path / "data.bin.zst"
+    archive.write_bytes(cctx.compress(payload[:60_000]) + cctx.compress(payload[60_000:]))
+
+    with patch('rl_cli.commands.object.ZSTD_BUFFER_SIZE', 16_384):
+        extract_archive(str(archive), str(tmp_path / "out"))
+
+    assert (tmp_path / "out" / "data.bin").read_bytes() == payload
+
+@pytest.mark.parametrize('declared_extra', [0, 500])
+@pytest.mark.asyncio
+async def test_object_download_single_stream_preallocates(tmp_path, declared_extra):
+    """Test a plain download reserves Content-Length up front and ends at the real size."""
+    payload = os.urandom(3000)
+    mock_api_client, mock_response = _streaming_download_mocks(payload, "data.bin")
+    mock_response.headers = {'content-length': str(len(payload) + declared_extra)}
+
+    target_path = tmp_path / "data.bin"
+    with patch('aiohttp.ClientSession') as mock_session, \
+         patch('rl_cli.utils.AsyncRunloop', return_value=mock_api_client), \
+         patch('rl_cli.commands.object._preallocate') as mock_preallocate, \
+         patch('sys.argv', ['rl', 'object', 'download', '--id', 'test-id', '--path', str(target_path)]), \
+         patch.dict('os.environ', {'RUNLOOP_API_KEY': 'test-api-key', 'RUNLOOP_ENV': 'dev'}):
+        session_instance = AsyncMock()
+        session_instance.get.return_value = mock_response
+        mock_session.return_value.__aenter__.return_value = session_instance
+        mock_preallocate.side_effect = lambda fd, size: os.ftruncate(fd, size)
+        await run()
+
+    assert mock_preallocate.call_args.args[1] == len(payload) + declared_extra
+    assert target_path.read_bytes() == payload
@@ -5,6 +5,8 @@ from unittest.mock import patch
 import pytest
 from dotenv import load_dotenv
 
+from rl_cli.utils import runloop_api_client
+
 # Load .env file if it exists
 load_dotenv()
 
@@ -15,6 +17,9 @@ def mock_env(request):
     Integration tests rely on the caller's shell env (real API key + env), so do not
     override env for tests under tests/integration or when RUN_E2E is set.
     """
+    # Each test builds its own API client: unit tests patch it, and a client
+    # cached by an earlier test is bound to that test's closed event loop
+    runloop_api_client.cache_clear()
     test_path = str(getattr(request.node, 'fspath', ''))
     if 'tests/integration/' in test_path or os.environ.get('RUN_E2E'):
         # Do not override env; rely on shell
@@ -5,7 +5,7 @@ import json
 import os
 from pathlib import Path
 import pytest
-from unittest.mock import patch, mock_open
+from unittest.mock import MagicMock, patch, mock_open
 
 from rl_cli.utils import (
     base_url,
@@ -15,7 +15,8 @@ from rl_cli.utils import (
     get_latest_version,
     update_check_cache,
 )
-from rl_cli.main import check_for_updates
+from rl_cli import __version__
+from rl_cli.main import check_for_updates, main
 
 def test_base_url_dev(mock_env):
     """Test base_url returns dev URL when RUNLOOP_ENV is 'dev'."""
@@ -87,10 +88,104 @@ def test_update_check_cache(temp_cache_dir):
 def test_check_for_updates(current_version, latest_version, should_notify, temp_cache_dir, capsys):
     """Test check_for_updates behavior with different versions."""
     with patch('rl_cli.main.__version__', current_version), \
-         patch('rl_cli.main.get_latest_version', return_value=latest_version):
+         patch('rl_cli.utils.get_latest_version', return_value=latest_version):
         check_for_updates()
         captured = capsys.readouterr()
         if should_notify:
             assert f"Update available: rl-cli {latest_version}" in captured.err
         else:
             assert captured.err == ""
+
+def test_main_uses_uvloop_when_available():
+    """Test main runs on uvloop's event loop when uvloop is importable."""
+    mock_uvloop = MagicMock()
+    with patch('rl_cli.main.uvloop', mock_uvloop), \
+         patch('rl_cli.main.run', new=MagicMock()), \
+         patch('rl_cli.main.asyncio.run') as mock_run:
+        main()
+        assert mock_run.call_args.kwargs['loop_factory'] is mock_uvloop.new_event_loop
+
+def test_main_without_uvloop():
+    """Test main falls back to the default event loop without uvloop."""
+    with patch('rl_cli.main.uvloop', None), \
+         patch('rl_cli.main.run', new=MagicMock()), \
+         patch('rl_cli.main.asyncio.run') as mock_run:
+        main()
+        assert mock_run.call_args.kwargs['loop_factory'] is None
+
+@pytest.mark.asyncio
+async def test_run_builds_only_selected_command_parser():
+    """Test run registers the full argument tree only for the command given."""
+    from rl_cli import main as main_module
+
+    setup_mocks = {name: MagicMock(wraps=setup) for name, setup in main_module.COMMAND_PARSERS.items()}
+    with patch.dict(main_module.COMMAND_PARSERS, setup_mocks), \
+         patch('rl_cli.main.check_for_updates'), \
+         patch('rl_cli.commands.object.list_objects') as mock_list, \
+         patch('sys.argv', ['rl', 'object', 'list']):
+        await main_module.run()
+
+    setup_mocks['object'].assert_called_once()
+    setup_mocks['devbox'].assert_not_called()
+    setup_mocks['blueprint'].assert_not_called()
+    mock_list.assert_called_once()
+
+@pytest.mark.parametrize('argv,expected', [
+    ([], None),
+    (['--version'], None),
+    (['-h', 'devbox'], 'devbox'),
+    (['object', 'download', '--id', 'x'], 'object'),
+])
+def test_sniff_command(argv, expected):
+    """Test the top-level command is picked out of argv."""
+    from rl_cli.main import _sniff_command
+
+    assert _sniff_command(argv) == expected
+
+def test_main_version_fast_path(capsys):
+    """Test a bare --version is answered without running the event loop."""
+    with patch('sys.argv', ['rl', '--version']), \
+         patch('rl_cli.main.asyncio.run') as mock_run:
+        main()
+    mock_run.assert_not_called()
+    assert capsys.readouterr().out == f"rl-cli {__version__}\n"
+
+@pytest.mark.parametrize('tty', [True, False])
+@pytest.mark.asyncio
+async def test_run_checks_for_updates_in_background(tty):
+    """Test the update check runs on a daemon thread, and only for a terminal."""
+    from rl_cli.main import run, _check_for_updates_quietly
+
+    with patch('rl_cli.main.threading.Thread') as mock_thread, \
+         patch('rl_cli.commands.object.list_objects') as mock_list, \
+         patch('sys.argv', ['rl', 'object', 'list']), \
+         patch('sys.stderr.isatty', return_value=tty):
+        await run()
+
+    if tty:
+        mock_thread.assert_called_once_with(target=_check_for_updates_quietly, daemon=True)
+        mock_thread.return_value.start.assert_called_once()
+    else:
+        mock_thread.assert_not_called()
+    mock_list.assert_called_once()
+
+@pytest.mark.parametrize('argv,env,tty,expected', [
+    (['rl', 'object', 'list'], 'dev', True, "Using dev environment\n"),
+    (['rl', 'object', 'list'], '', True, "Using prod environment\n"),
+    (['rl', 'object', 'list'], 'dev', False, ""),
+    (['rl', 'devbox', 'ssh', '--id', 'dbx', '--config-only'], 'dev', True, ""),
+])
+@pytest.mark.asyncio
+async def test_run_environment_message(argv, env, tty, expected, capsys):
+    """Test the environment notice, which SSH config-only output and non-TTY stderr omit."""
+    from rl_cli.main import run
+
+    with patch('rl_cli.main.threading.Thread'), \
+         patch('rl_cli.commands.object.list_objects'), \
+         patch('rl_cli.commands.devbox.ssh'), \
+         patch('sys.argv', argv), \
+         patch('sys.stderr.isatty', return_value=tty), \
+         patch.dict(os.environ, {'RUNLOOP_ENV': env}):
+        await run()
+
+    assert capsys.readouterr().err == expected